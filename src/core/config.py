@@ -1,33 +1,97 @@
 # src/core/config.py
+import atexit
 import logging
-
-# Configuration du logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Configuration du logging
 # Path to log errors in the ops directory as requested (local only)
 OPS_LOG_DIR = "/media/machi/Data/Dev/machi-workspace/machi-projects/machi00_ops/machi05_astro-wiki-builder/debug-logs"
 LOG_FILE = os.path.join(OPS_LOG_DIR, "astro_builder.log")
 
-# Assurez-vous que le répertoire existe
-if not os.path.exists(OPS_LOG_DIR):
-    try:
-        os.makedirs(OPS_LOG_DIR, exist_ok=True)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# PID du processus déjà configuré (un processus fils issu d'un fork doit se reconfigurer)
+_logging_configured_pid: int | None = None
+
+
+def _build_log_handlers() -> list[logging.Handler]:
+    """Handlers console et fichier (si le répertoire des logs est accessible), formatés."""
+    # Assurez-vous que le répertoire existe
+    if not os.path.exists(OPS_LOG_DIR):
+        try:
+            os.makedirs(OPS_LOG_DIR, exist_ok=True)
+            use_file_logging = True
+        except Exception:
+            use_file_logging = False
+    else:
         use_file_logging = True
-    except Exception:
-        use_file_logging = False
-else:
-    use_file_logging = True
-
-handlers = [logging.StreamHandler()]
-if use_file_logging:
-    handlers.append(logging.FileHandler(LOG_FILE, encoding='utf-8'))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=handlers
-)
+
+    handlers = [logging.StreamHandler()]
+    if use_file_logging:
+        handlers.append(logging.FileHandler(LOG_FILE, encoding='utf-8'))
+
+    log_formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(log_formatter)
+    return handlers
+
+
+def configure_logging() -> None:
+    """
+    Configure le logging racine (console + fichier), une seule fois par processus.
+
+    Appelée par les points d'entrée plutôt qu'à l'import du module : importer la
+    configuration ne touche plus au système de fichiers.
+    """
+    global _logging_configured_pid
+    if _logging_configured_pid == os.getpid():
+        return
+    _logging_configured_pid = os.getpid()
+
+    # Les écritures (console + fichier) sont faites par un thread dédié : les appels
+    # à logger.* se contentent de mettre l'enregistrement en file d'attente
+    handlers = _build_log_handlers()
+    log_queue: queue.Queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    # Message brut mis en file ; le format complet est appliqué par le listener
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # force=True : remplace les handlers hérités du processus parent
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler],
+        force=True,
+    )
+
+
+def configure_worker_logging() -> None:
+    """
+    Configure le logging d'un processus de travail, avec des handlers synchrones.
+
+    Initializer des pools de processus : un worker se termine par os._exit, sans
+    passer par atexit, donc un QueueListener n'y serait jamais vidé. Chaque
+    enregistrement est écrit directement, sans file ni thread.
+    """
+    global _logging_configured_pid
+    if _logging_configured_pid == os.getpid():
+        return
+    _logging_configured_pid = os.getpid()
+
+    # force=True : remplace le QueueHandler hérité du processus parent
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=_build_log_handlers(),
+        force=True,
+    )
+
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 # Configuration des chemins
@@ -36,6 +100,9 @@ DEFAULT_CONSOLIDATED_DIR = "data/generated/consolidated"
 DEFAULT_DRAFTS_DIR = "data/drafts"
 DEFAULT_CACHE_DIR = "data/cache"
 
+# Taille du tampon d'écriture des exports volumineux (CSV, JSON) : 128 Kio
+WRITE_BUFFER_SIZE = 128 * 1024
+
 # Configuration des User-Agents
 DEFAULT_WIKI_USER_AGENT = (
     "AstroWikiBuilder/1.1 (bot; machichiotte@gmail.com or your_project_contact_page)"
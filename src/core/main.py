@@ -5,6 +5,7 @@ Point d'entrée principal de l'application AstroWikiBuilder.
 Ce module simplifié délègue toute la logique aux modules d'orchestration.
 """
 
+from src.core.config import configure_logging
 from src.orchestration.cli_parser import parse_cli_arguments
 from src.orchestration.pipeline_executor import execute_pipeline
 
@@ -15,6 +16,7 @@ def main() -> None:
 
     Parse les arguments CLI et exécute le pipeline complet.
     """
+    configure_logging()
     args = parse_cli_arguments()
     execute_pipeline(args)
 
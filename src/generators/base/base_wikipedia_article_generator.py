@@ -29,7 +29,8 @@ class BaseWikipediaArticleGenerator:
         source = f"{{{{Source unique|date={current_date}}}}}"
         return f"{stub}\n{source}"
 
-    def _format_french_month_year(self) -> str:
+    @staticmethod
+    def _format_french_month_year() -> str:
         now_utc = datetime.datetime.now(pytz.utc)
         paris_tz = pytz.timezone("Europe/Paris")
         now_paris = now_utc.astimezone(paris_tz)
@@ -104,11 +104,33 @@ def parse_cli_arguments() -> argparse.Namespace:
         help="Ne PAS générer les brouillons d'étoiles",
     )
 
+    parser.add_argument(
+        "--draft-cache",
+        action="store_true",
+        default=True,
+        help="Réutiliser les brouillons d'exoplanètes inchangées depuis le dernier run (activé par défaut)",
+    )
+
+    parser.add_argument(
+        "--no-draft-cache",
+        dest="draft_cache",
+        action="store_false",
+        help="Ne PAS utiliser le cache des brouillons (régénère tout)",
+    )
+
+    parser.add_argument(
+        "--compare-existing",
+        action="store_true",
+        default=False,
+        help="Générer aussi les brouillons des exoplanètes ayant déjà un article (pour comparaison)",
+    )
+
     args = parser.parse_args()
     logger.info(
         f"Arguments reçus : Sources={args.sources}, Mocks={args.use_mock}, "
         f"SkipWikiCheck={args.skip_wikipedia_check}, "
         f"GenerateExoplanets={args.generate_exoplanets}, GenerateStars={args.generate_stars}, "
+        f"DraftCache={args.draft_cache}, CompareExisting={args.compare_existing}, "
         f"OutputDir={args.output_dir}, DraftsDir={args.drafts_dir}"
     )
     return args
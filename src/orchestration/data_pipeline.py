@@ -10,13 +10,27 @@ Responsabilité :
 """
 
 import json
+import logging
 import os
+from collections.abc import Iterable
 from typing import Any
 
-from src.core.config import logger
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur le module json standard
+    orjson = None
+
+from src.core.config import WRITE_BUFFER_SIZE, logger
 from src.services.processors.data_processor import DataProcessor
 from src.services.processors.statistics_service import StatisticsService
 
+# Abréviations des sources utilisées dans le nom des fichiers consolidés
+SOURCE_ABBREV: dict[str, str] = {
+    "nasa_exoplanet_archive": "nea",
+    "exoplanet_eu": "exoplanet_eu",
+    "open_exoplanet": "open_exoplanet",
+}
+
 
 def fetch_and_ingest_data(collectors: dict[str, Any], processor: DataProcessor) -> None:
     """
@@ -58,8 +72,26 @@ def fetch_and_ingest_data(collectors: dict[str, Any], processor: DataProcessor)
             logger.info(f"Aucune étoile récupérée depuis {source_name}.")
 
 
+def build_source_prefix(sources_list: Iterable[str] | None) -> str:
+    """
+    Construit le préfixe des fichiers consolidés à partir des sources utilisées.
+
+    Args:
+        sources_list: Noms des sources (ordre indifférent)
+
+    Returns:
+        str: Abréviations triées jointes par "_", ou "consolidated" sans source
+    """
+    if not sources_list:
+        return "consolidated"
+    return "_".join(SOURCE_ABBREV.get(source, source) for source in sorted(sources_list))
+
+
 def export_consolidated_data(
-    processor: DataProcessor, output_dir: str, timestamp: str, sources_list: list[str] = None
+    processor: DataProcessor,
+    output_dir: str,
+    timestamp: str,
+    source_prefix: str = "consolidated",
 ) -> None:
     """
     Exporte les données consolidées au format CSV.
@@ -68,25 +100,10 @@ def export_consolidated_data(
         processor: Instance du DataProcessor contenant les données
         output_dir: Répertoire de sortie
         timestamp: Timestamp pour nommer les fichiers
-        sources_list: Liste des sources utilisées pour générer le nom du fichier
+        source_prefix: Préfixe du fichier, calculé une fois par build_source_prefix
     """
     logger.info("Export des données consolidées...")
     try:
-        # Générer le nom de fichier basé sur les sources
-        if sources_list:
-            # Mapper les noms de sources vers des abréviations
-            source_abbrev = {
-                "nasa_exoplanet_archive": "nea",
-                "exoplanet_eu": "exoplanet_eu",
-                "open_exoplanet": "open_exoplanet",
-            }
-            # Créer le préfixe à partir des sources
-            source_prefix = "_".join(
-                source_abbrev.get(source, source) for source in sorted(sources_list)
-            )
-        else:
-            source_prefix = "consolidated"
-
         consolidated_path = f"{output_dir}/consolidated/{source_prefix}_{timestamp}.csv"
         processor.export_all_exoplanets("csv", consolidated_path)
         logger.info(f"Données consolidées exportées vers : {consolidated_path}")
@@ -128,24 +145,6 @@ def generate_and_export_statistics(
     return stats
 
 
-def _sort_dict_recursively(data: Any) -> Any:
-    """
-    Trie récursivement tous les dictionnaires par clé.
-
-    Args:
-        data: Données à trier (peut être dict, list, ou autre)
-
-    Returns:
-        Données triées
-    """
-    if isinstance(data, dict):
-        return {k: _sort_dict_recursively(v) for k, v in sorted(data.items())}
-    elif isinstance(data, list):
-        return [_sort_dict_recursively(item) for item in data]
-    else:
-        return data
-
-
 def _export_statistics_json(stats: dict[str, Any], output_dir: str, timestamp: str) -> None:
     """
     Sauvegarde les statistiques dans un fichier JSON.
@@ -158,12 +157,22 @@ def _export_statistics_json(stats: dict[str, Any], output_dir: str, timestamp: s
     stats_dir = os.path.join(output_dir, "statistics")
     os.makedirs(stats_dir, exist_ok=True)
 
-    # Trier tous les dictionnaires pour une meilleure lisibilité
-    sorted_stats = _sort_dict_recursively(stats)
-
+    # Les clés sont triées par l'encodeur JSON pour une meilleure lisibilité
     stats_path = os.path.join(stats_dir, f"statistics_{timestamp}.json")
-    with open(stats_path, "w", encoding="utf-8") as f:
-        json.dump(sorted_stats, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Sérialisation en C vers un unique buffer d'octets (UTF-8, non échappé)
+        data = orjson.dumps(
+            stats,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        with open(stats_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(stats_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            json.dump(stats, f, indent=2, ensure_ascii=False, sort_keys=True)
     logger.info(f"Statistiques sauvegardées dans {stats_path}")
 
 
@@ -171,6 +180,9 @@ def _log_statistics(stats: dict[str, Any]) -> None:
     """
     Affiche les statistiques en appelant des fonctions dédiées.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     exo_stats = stats.get("exoplanet", {})
     star_stats = stats.get("star", {})
 
@@ -183,21 +195,26 @@ def _log_statistics(stats: dict[str, Any]) -> None:
 
 
 def _log_category_stats(title: str, data: dict, total: int, sort_keys: bool = False) -> None:
-    """Affiche les statistiques d'une catégorie donnée (avec %)"""
-    logger.info(f"  {title} :")
+    """Affiche les statistiques d'une catégorie donnée (avec %) en un seul message"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
     items = sorted(data.items(), key=lambda x: str(x[0])) if sort_keys else data.items()
 
-    for key, count in items:
-        # Simplification : déplacer le calcul du pourcentage dans une fonction de formatage
-        percentage = (count / total * 100) if total > 0 else 0
-        logger.info(f"    - {key} : {count} ({percentage:.1f}%)")
+    # Facteur calculé une fois plutôt qu'un test par ligne
+    inv_total = 100.0 / total if total > 0 else 0.0
+    lines = [f"  {title} :"]
+    lines.extend(f"    - {key} : {count} ({count * inv_total:.1f}%)" for key, count in items)
+    logger.info("\n".join(lines))
 
-    # CC de cette fonction : 1 (boucle 'for') + 1 (if dans le calcul percentage) + 1 (if sort_keys) = 3 + 1 = 4
+    # CC de cette fonction : 1 (if sort_keys) + 1 (if dans inv_total) + 1 = 3
 
 
 def _log_statistics_exoplanets(exo_stats: dict[str, Any]) -> None:
     """Affiche les statistiques pour les exoplanètes."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     total_exo = exo_stats.get("total", 0)
 
     logger.info("Statistiques des exoplanètes collectées :")
@@ -254,6 +271,9 @@ def _log_statistics_stars(star_stats: dict[str, Any]) -> None:
     """
     Affiche les statistiques pour les étoiles.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     total_stars = star_stats.get("total_stars", 0)
 
     logger.info("Statistiques des étoiles collectées :")
@@ -41,8 +41,7 @@ def generate_and_persist_exoplanet_drafts(
     exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
     for exoplanet in exoplanets:
         if isinstance(exoplanet, Exoplanet) and exoplanet.st_name:
-            star_name = str(exoplanet.st_name)
-            exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
+            exoplanets_by_star_name.setdefault(exoplanet.st_name, []).append(exoplanet)
 
     logger.info(f"Index créé pour {len(exoplanets_by_star_name)} systèmes planétaires")
 
@@ -57,7 +56,7 @@ def generate_and_persist_exoplanet_drafts(
             # Récupérer les planètes du même système
             system_planets = []
             if exoplanet.st_name:
-                system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
+                system_planets = exoplanets_by_star_name.get(exoplanet.st_name, [])
 
             exoplanet_drafts[exoplanet_name] = build_exoplanet_article_draft(
                 exoplanet, system_planets=system_planets
@@ -99,14 +98,7 @@ def generate_and_persist_star_drafts(
     logger.info(f"Génération de {total} brouillons d'étoiles...")
 
     # Créer un index des exoplanètes par nom d'étoile hôte
-    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-    if exoplanets:
-        for exoplanet in exoplanets:
-            if hasattr(exoplanet, "st_name") and exoplanet.st_name:
-                star_name = str(exoplanet.st_name)
-                exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
-
-        logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
+    exoplanets_by_star_name = _index_exoplanets_by_star_name(exoplanets)
 
     star_drafts = {}
     for idx, star in enumerate(stars, 1):
@@ -136,6 +128,7 @@ def generate_and_persist_star_drafts_separated(
     exoplanets: list[Exoplanet],
     existing_star_articles: dict,
     missing_star_articles: dict,
+    exoplanets_by_star_name: dict[str, list[Exoplanet]] | None = None,
 ) -> None:
     """
     Génère et sauvegarde les brouillons d'étoiles en les séparant
@@ -147,20 +140,16 @@ def generate_and_persist_star_drafts_separated(
         exoplanets: Liste d'exoplanètes pour enrichissement
         existing_star_articles: Dict des étoiles avec articles existants
         missing_star_articles: Dict des étoiles sans articles
+        exoplanets_by_star_name: Index déjà construit des exoplanètes par étoile
+            (évite de regrouper une seconde fois les mêmes exoplanètes)
     """
     stars: list[Star] = processor.collect_all_stars()
     total = len(stars)
     logger.info(f"Génération de {total} brouillons d'étoiles (séparés par statut)...")
 
-    # Créer un index des exoplanètes par nom d'étoile hôte
-    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-    if exoplanets:
-        for exoplanet in exoplanets:
-            if hasattr(exoplanet, "st_name") and exoplanet.st_name:
-                star_name = str(exoplanet.st_name)
-                exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
-
-        logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
+    # Réutiliser l'index fourni ou créer un index des exoplanètes par nom d'étoile hôte
+    if exoplanets_by_star_name is None:
+        exoplanets_by_star_name = _index_exoplanets_by_star_name(exoplanets)
 
     # Séparer les étoiles selon leur statut Wikipedia
     stars_existing = [s for s in stars if s.st_name in existing_star_articles]
@@ -213,3 +202,26 @@ def generate_and_persist_star_drafts_separated(
         f"Brouillons d'étoiles sauvegardés : {len(missing_drafts)} manquantes, "
         f"{len(existing_drafts)} existantes"
     )
+
+
+def _index_exoplanets_by_star_name(
+    exoplanets: list[Exoplanet] | None,
+) -> dict[str, list[Exoplanet]]:
+    """
+    Regroupe les exoplanètes par nom d'étoile hôte.
+
+    Args:
+        exoplanets: Liste optionnelle d'exoplanètes
+
+    Returns:
+        dict[str, list[Exoplanet]]: {nom de l'étoile: exoplanètes du système}
+    """
+    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
+    if exoplanets:
+        for exoplanet in exoplanets:
+            star_name = getattr(exoplanet, "st_name", None)
+            if star_name:
+                exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
+
+        logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
+    return exoplanets_by_star_name
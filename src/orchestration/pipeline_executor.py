@@ -9,10 +9,24 @@ Responsabilité :
 """
 
 import argparse
+import logging
+import os
+import pickle
+from collections.abc import Collection, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 
-from src.core.config import DEFAULT_CONSOLIDATED_DIR, logger
+from src.core.config import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CONSOLIDATED_DIR,
+    configure_logging,
+    configure_worker_logging,
+    logger,
+)
+from src.models.entities.exoplanet_entity import Exoplanet
 from src.orchestration.data_pipeline import (
+    build_source_prefix,
     export_consolidated_data,
     fetch_and_ingest_data,
     generate_and_export_statistics,
@@ -27,6 +41,11 @@ from src.orchestration.service_initializer import (
 )
 from src.services.processors.data_processor import DataProcessor
 from src.utils.directory_util import create_output_directories
+from src.utils.wikipedia.draft_cache import DraftCache, compute_draft_cache_key
+
+# En dessous de ce seuil, le coût de démarrage des processus dépasse le gain
+PARALLEL_DRAFT_THRESHOLD = 256
+DRAFT_CHUNKSIZE = 64
 
 
 def execute_pipeline(args: argparse.Namespace) -> None:
@@ -49,6 +68,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
         >>> args = parse_cli_arguments()
         >>> execute_pipeline(args)
     """
+    configure_logging()
     logger.info("Démarrage du pipeline AstroWikiBuilder...")
 
     # Étape 1 : Création des répertoires de sortie
@@ -57,6 +77,8 @@ def execute_pipeline(args: argparse.Namespace) -> None:
     # Étape 2 : Initialisation des services et collecteurs
     services = initialize_services()
     collectors = initialize_collectors(args)
+    # Préfixe des fichiers consolidés, fixé pour toute l'exécution
+    source_prefix = build_source_prefix(collectors.keys())
 
     # Étape 3 : Initialisation du processeur de données
     processor = _initialize_data_processor(services)
@@ -66,8 +88,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
 
     # Étape 5 : Export des données consolidées
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sources_list = list(collectors.keys())  # Récupérer les noms des sources utilisées
-    export_consolidated_data(processor, args.output_dir, timestamp, sources_list)
+    export_consolidated_data(processor, args.output_dir, timestamp, source_prefix)
 
     # Étape 6 : Génération et affichage des statistiques
     stat_service = services[2]  # StatisticsService est à l'index 2
@@ -92,6 +113,9 @@ def execute_pipeline(args: argparse.Namespace) -> None:
             logger.info("Génération des étoiles désactivée (--no-generate-stars)")
     else:
         # Mode production : générer les drafts pour les articles existants ET manquants
+        # Index par étoile construit pour les exoplanètes, réutilisé pour les étoiles
+        exoplanets_by_star_name = None
+        reuse_index_for_stars = False
 
         # Génération des exoplanètes
         if args.generate_exoplanets:
@@ -105,72 +129,70 @@ def execute_pipeline(args: argparse.Namespace) -> None:
                 f"{len(missing_articles)} exoplanètes sans articles"
             )
 
-            # Récupérer toutes les exoplanètes et créer l'index par système
+            # Récupérer toutes les exoplanètes, créer l'index par système et
+            # séparer les exoplanètes selon leur statut Wikipedia (en une seule passe)
             all_exoplanets = processor.collect_all_exoplanets()
-
-            from src.models.entities.exoplanet_entity import Exoplanet
-
-            exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-            for exoplanet in all_exoplanets:
-                if isinstance(exoplanet, Exoplanet) and exoplanet.st_name:
-                    star_name = str(exoplanet.st_name)
-                    exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
+            exoplanets_by_star_name, exoplanets_missing, exoplanets_existing = (
+                _index_and_partition_exoplanets(all_exoplanets, existing_articles, missing_articles)
+            )
 
             logger.info(f"Index créé pour {len(exoplanets_by_star_name)} systèmes planétaires")
 
-            # Séparer les exoplanètes selon leur statut Wikipedia
-            exoplanets_missing = [exo for exo in all_exoplanets if exo.pl_name in missing_articles]
-            exoplanets_existing = [
-                exo for exo in all_exoplanets if exo.pl_name in existing_articles
-            ]
+            # Les étoiles ne voient que les exoplanètes manquantes ou existantes : l'index
+            # n'est réutilisé que s'il couvre exactement ces deux ensembles
+            reuse_index_for_stars = len(exoplanets_missing) + len(exoplanets_existing) == len(
+                all_exoplanets
+            )
 
             logger.info(
                 f"Génération des brouillons : {len(exoplanets_missing)} manquants, "
                 f"{len(exoplanets_existing)} existants"
             )
 
-            from src.utils.wikipedia.draft_util import (
-                build_exoplanet_article_draft,
-                persist_drafts_by_entity_type,
-            )
+            from src.utils.wikipedia.draft_util import persist_drafts_by_entity_type
+
+            draft_cache = None
+            if getattr(args, "draft_cache", False):
+                draft_cache = DraftCache(os.path.join(DEFAULT_CACHE_DIR, "drafts"))
+                logger.info(f"Cache des brouillons activé : {draft_cache.path}")
 
             # Générer les drafts pour les exoplanètes MANQUANTES
             missing_drafts = {}
             if exoplanets_missing:
-                total_missing = len(exoplanets_missing)
-                logger.info(f"Génération de {total_missing} brouillons manquants...")
-
-                for idx, exoplanet in enumerate(exoplanets_missing, 1):
-                    if idx % 500 == 0 or idx == total_missing:
-                        logger.info(f"  Progression manquants: {idx}/{total_missing}")
-
-                    system_planets = []
-                    if exoplanet.st_name:
-                        system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
-
-                    missing_drafts[exoplanet.pl_name] = build_exoplanet_article_draft(
-                        exoplanet, system_planets=system_planets
-                    )
+                logger.info(f"Génération de {len(exoplanets_missing)} brouillons manquants...")
+                missing_drafts = _build_exoplanet_drafts(
+                    exoplanets_missing,
+                    exoplanets_by_star_name,
+                    "manquants",
+                    log_every=500,
+                    draft_cache=draft_cache,
+                )
 
-            # Générer les drafts pour les exoplanètes EXISTANTES (pour comparaison)
+            # Générer les drafts pour les exoplanètes EXISTANTES (pour comparaison, sur demande)
             existing_drafts = {}
-            if exoplanets_existing:
-                total_existing = len(exoplanets_existing)
+            compare_existing = getattr(args, "compare_existing", False)
+            if exoplanets_existing and not compare_existing:
                 logger.info(
-                    f"Génération de {total_existing} brouillons existants (pour comparaison)..."
+                    f"{len(exoplanets_existing)} brouillons existants ignorés "
+                    "(--compare-existing pour les générer)"
+                )
+            elif exoplanets_existing:
+                logger.info(
+                    f"Génération de {len(exoplanets_existing)} brouillons existants (pour comparaison)..."
+                )
+                existing_drafts = _build_exoplanet_drafts(
+                    exoplanets_existing,
+                    exoplanets_by_star_name,
+                    "existants",
+                    log_every=100,
+                    draft_cache=draft_cache,
                 )
 
-                for idx, exoplanet in enumerate(exoplanets_existing, 1):
-                    if idx % 100 == 0 or idx == total_existing:
-                        logger.info(f"  Progression existants: {idx}/{total_existing}")
-
-                    system_planets = []
-                    if exoplanet.st_name:
-                        system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
-
-                    existing_drafts[exoplanet.pl_name] = build_exoplanet_article_draft(
-                        exoplanet, system_planets=system_planets
-                    )
+            if draft_cache is not None:
+                pruned = draft_cache.prune_untouched()
+                if pruned:
+                    logger.info(f"Cache des brouillons : {pruned} brouillons obsolètes supprimés")
+                draft_cache.close()
 
             # Sauvegarder dans les bons dossiers
             persist_drafts_by_entity_type(
@@ -203,6 +225,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
             all_exoplanets_to_draft = exoplanets_missing + exoplanets_existing
             if all_exoplanets_to_draft or not args.generate_exoplanets:
                 # Si on ne génère pas les exoplanètes, récupérer toutes les exoplanètes quand même
+                # (l'index sera alors construit par le pipeline des étoiles)
                 if not args.generate_exoplanets:
                     all_exoplanets_to_draft = processor.collect_all_exoplanets()
 
@@ -216,6 +239,9 @@ def execute_pipeline(args: argparse.Namespace) -> None:
                     all_exoplanets_to_draft,
                     existing_star_articles,
                     missing_star_articles,
+                    exoplanets_by_star_name=(
+                        exoplanets_by_star_name if reuse_index_for_stars else None
+                    ),
                 )
         else:
             logger.info("Génération des étoiles désactivée (--no-generate-stars)")
@@ -262,3 +288,188 @@ def _initialize_data_processor(services: tuple) -> DataProcessor:
 
     logger.info("DataProcessor initialisé.")
     return processor
+
+
+def _index_and_partition_exoplanets(
+    all_exoplanets: list,
+    existing_articles: Collection[str],
+    missing_articles: Collection[str],
+) -> tuple[dict[str, list], list, list]:
+    """
+    Indexe les exoplanètes par étoile hôte et les sépare selon leur statut Wikipedia.
+
+    Les noms d'articles sont convertis une seule fois en ensembles, puis la liste
+    des exoplanètes est parcourue une seule fois.
+
+    Args:
+        all_exoplanets: Toutes les exoplanètes consolidées
+        existing_articles: Noms des exoplanètes ayant un article
+        missing_articles: Noms des exoplanètes sans article
+
+    Returns:
+        tuple: (index par nom d'étoile, exoplanètes manquantes, exoplanètes existantes)
+    """
+    missing_set = set(missing_articles)
+    existing_set = set(existing_articles)
+
+    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
+    exoplanets_missing: list[Exoplanet] = []
+    exoplanets_existing: list[Exoplanet] = []
+
+    for exoplanet in all_exoplanets:
+        if isinstance(exoplanet, Exoplanet) and exoplanet.st_name:
+            exoplanets_by_star_name.setdefault(exoplanet.st_name, []).append(exoplanet)
+
+        name = exoplanet.pl_name
+        if name in missing_set:
+            exoplanets_missing.append(exoplanet)
+        elif name in existing_set:
+            exoplanets_existing.append(exoplanet)
+
+    return exoplanets_by_star_name, exoplanets_missing, exoplanets_existing
+
+
+def _build_one_exoplanet_draft(item: tuple) -> tuple[str, str]:
+    """
+    Génère le brouillon d'une exoplanète (worker du pool de processus).
+
+    Args:
+        item: Tuple (exoplanète, planètes du même système)
+
+    Returns:
+        tuple[str, str]: (nom de la planète, contenu du brouillon)
+    """
+    from src.utils.wikipedia.draft_util import build_exoplanet_article_draft
+
+    exoplanet, system_planets = item
+    return exoplanet.pl_name, build_exoplanet_article_draft(
+        exoplanet, system_planets=system_planets
+    )
+
+
+def _iter_draft_items(
+    exoplanets: list, exoplanets_by_star_name: dict[str, list]
+) -> Iterator[tuple]:
+    """
+    Associe chaque exoplanète aux planètes de son système.
+
+    L'index est parcouru étoile par étoile : la liste du système est récupérée une
+    seule fois par étoile et partagée par toutes ses planètes. Les planètes absentes
+    de l'index (sans étoile hôte) sont traitées ensuite.
+    """
+    pending = {id(exoplanet): exoplanet for exoplanet in exoplanets}
+
+    for system_planets in exoplanets_by_star_name.values():
+        for exoplanet in system_planets:
+            if pending.pop(id(exoplanet), None) is not None:
+                yield exoplanet, system_planets
+
+    for exoplanet in pending.values():
+        star_name = exoplanet.st_name
+        yield exoplanet, exoplanets_by_star_name.get(star_name, []) if star_name else []
+
+
+def _build_exoplanet_drafts(
+    exoplanets: list,
+    exoplanets_by_star_name: dict[str, list],
+    label: str,
+    log_every: int = 100,
+    draft_cache: DraftCache | None = None,
+) -> dict[str, str]:
+    """
+    Génère les brouillons d'une liste d'exoplanètes.
+
+    Si un cache est fourni, les brouillons des planètes inchangées (même empreinte)
+    sont réutilisés et seuls les autres sont générés puis enregistrés.
+
+    Args:
+        exoplanets: Exoplanètes à traiter
+        exoplanets_by_star_name: Index des exoplanètes par nom d'étoile hôte
+        label: Libellé utilisé dans les logs de progression
+        log_every: Fréquence des logs de progression
+        draft_cache: Cache persistant des brouillons (optionnel)
+
+    Returns:
+        dict[str, str]: Brouillons indexés par nom de planète
+    """
+    items = list(_iter_draft_items(exoplanets, exoplanets_by_star_name))
+    if draft_cache is None:
+        return _generate_exoplanet_drafts(items, label, log_every)
+
+    drafts: dict[str, str] = {}
+    pending_items = []
+    pending_keys: dict[str, str] = {}
+    for exoplanet, system_planets in items:
+        key = compute_draft_cache_key(exoplanet, system_planets)
+        cached = draft_cache.get(key)
+        if cached is None:
+            pending_items.append((exoplanet, system_planets))
+            pending_keys[exoplanet.pl_name] = key
+        else:
+            drafts[exoplanet.pl_name] = cached
+
+    logger.info(
+        f"  Cache {label}: {len(drafts)} brouillons réutilisés, {len(pending_items)} à générer"
+    )
+
+    generated = _generate_exoplanet_drafts(pending_items, label, log_every)
+    draft_cache.put_many((pending_keys[name], draft) for name, draft in generated.items())
+    drafts.update(generated)
+    return drafts
+
+
+def _ensure_picklable(item: tuple) -> None:
+    """
+    Vérifie qu'un élément peut être envoyé aux workers du pool.
+
+    Selon l'objet, pickle échoue par PicklingError, AttributeError (objet local) ou
+    TypeError : les deux dernières sont converties ici, avant le lancement du pool,
+    pour ne pas confondre une erreur de génération avec une erreur de sérialisation.
+
+    Raises:
+        pickle.PicklingError: Si l'élément n'est pas sérialisable
+    """
+    try:
+        pickle.dumps(item)
+    except (AttributeError, TypeError) as e:
+        raise pickle.PicklingError(str(e)) from e
+
+
+def _generate_exoplanet_drafts(items: list[tuple], label: str, log_every: int) -> dict[str, str]:
+    """
+    Génère les brouillons des couples (exoplanète, système) fournis.
+
+    La génération est purement CPU : au-delà de PARALLEL_DRAFT_THRESHOLD planètes,
+    elle est répartie sur un ProcessPoolExecutor. Si les objets ne sont pas
+    sérialisables (ou si le pool échoue), on retombe sur la boucle séquentielle ;
+    une erreur levée par un générateur dans un worker est propagée telle quelle.
+    """
+    total = len(items)
+    drafts: dict[str, str] = {}
+    # Évaluée une fois : aucun formatage de progression si INFO est désactivé
+    log_progress = logger.isEnabledFor(logging.INFO)
+
+    if total >= PARALLEL_DRAFT_THRESHOLD:
+        try:
+            # Les éléments sont homogènes : sonder le premier suffit
+            _ensure_picklable(items[0])
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(), initializer=configure_worker_logging
+            ) as executor:
+                results = executor.map(_build_one_exoplanet_draft, items, chunksize=DRAFT_CHUNKSIZE)
+                for idx, (name, draft) in enumerate(results, 1):
+                    if log_progress and (idx % log_every == 0 or idx == total):
+                        logger.info(f"  Progression {label}: {idx}/{total}")
+                    drafts[name] = draft
+            return drafts
+        except (pickle.PicklingError, BrokenProcessPool) as e:
+            logger.warning(f"Génération parallèle impossible ({e}), passage en séquentiel")
+            drafts.clear()
+
+    for idx, item in enumerate(items, 1):
+        if log_progress and (idx % log_every == 0 or idx == total):
+            logger.info(f"  Progression {label}: {idx}/{total}")
+        name, draft = _build_one_exoplanet_draft(item)
+        drafts[name] = draft
+
+    return drafts
@@ -4,6 +4,7 @@ import json
 import logging
 from typing import Any
 
+from src.core.config import WRITE_BUFFER_SIZE
 from src.models.entities.exoplanet_entity import Exoplanet
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -114,7 +115,9 @@ class ExportService:
             return
 
         try:
-            with open(filename, "w", newline="", encoding="utf-8") as f:
+            with open(
+                filename, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+            ) as f:
                 writer = csv.DictWriter(
                     f, fieldnames=self._exoplanet_to_dict_flat(exoplanets[0]).keys()
                 )
@@ -134,7 +137,7 @@ class ExportService:
             return
 
         try:
-            with open(filename, "w", encoding="utf-8") as f:
+            with open(filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
                 json.dump(
                     [self._exoplanet_to_dict_flat(exoplanet) for exoplanet in exoplanets],
                     f,
@@ -45,6 +45,11 @@ class DataProcessor:
 
     def ingest_exoplanets_from_source(self, exoplanets: list[Exoplanet], source_name: str) -> None:
         """Ajoute ou fusionne les exoplanètes dans le référentiel."""
+        # Normalisation unique : st_name est ensuite toujours str | None en aval
+        for exoplanet in exoplanets:
+            star_name = exoplanet.st_name
+            if star_name is not None and not isinstance(star_name, str):
+                exoplanet.st_name = str(star_name)
         self.exoplanet_repository.add_exoplanets(exoplanets, source_name)
 
     def ingest_stars_from_source(self, stars: list[Star], source_name: str) -> None:
@@ -1,5 +1,7 @@
 import ast
+import dataclasses
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -14,6 +16,13 @@ if str(project_root) not in sys.path:
 from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty  # noqa: E402
 from src.utils.wikipedia.draft_util import build_exoplanet_article_draft  # noqa: E402
 
+# Champs attendus par Exoplanet (pour filtrer ce qu'on envoie au constructeur)
+_EXOPLANET_FIELDS = frozenset(f.name for f in dataclasses.fields(Exoplanet))
+# Champs textuels : lus en chaînes pour éviter la détection de dates du moteur pyarrow
+_TEXT_FIELDS = frozenset(
+    f.name for f in dataclasses.fields(Exoplanet) if f.type in (str, str | None)
+)
+
 # Config de la page
 st.set_page_config(
     page_title="AstroWikiBuilder",
@@ -25,6 +34,35 @@ st.set_page_config(
 # --- UTILS ---
 
 
+_NUMBER_OR_NONE = r"None|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_VWU_RE = re.compile(
+    rf"^ValueWithUncertainty\(\s*value=(?P<value>{_NUMBER_OR_NONE}),"
+    rf"\s*error_positive=(?P<error_positive>{_NUMBER_OR_NONE}),"
+    rf"\s*error_negative=(?P<error_negative>{_NUMBER_OR_NONE}),"
+    r"\s*sign=(?P<sign>None|'[^']*'|\"[^\"]*\")\s*\)$"
+)
+
+
+def _parse_number(text):
+    """Convertit un littéral numérique (ou 'None') comme le ferait Python."""
+    if text == "None":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _vwu_from_groups(value, error_positive, error_negative, sign):
+    """Construit un ValueWithUncertainty à partir des groupes capturés par _VWU_RE."""
+    return ValueWithUncertainty(
+        value=_parse_number(value),
+        error_positive=_parse_number(error_positive),
+        error_negative=_parse_number(error_negative),
+        sign=None if sign == "None" else sign[1:-1],
+    )
+
+
 def parse_value_with_uncertainty(val_str):
     """
     Convertit une chaîne 'ValueWithUncertainty(...)' en objet réel.
@@ -34,64 +72,158 @@ def parse_value_with_uncertainty(val_str):
         return None
 
     # Nettoyage basique
-    val_str = val_str.strip()
-    if not val_str.startswith("ValueWithUncertainty"):
-        return None
-
-    try:
-        # On utilise eval dans un contexte restreint où seule la classe est connue
-        # C'est safe car on contrôle le CSV source
-        return eval(val_str, {"ValueWithUncertainty": ValueWithUncertainty, "None": None})  # nosec
-    except Exception:
-        # Fallback silencieux
+    match = _VWU_RE.fullmatch(val_str.strip())
+    if match is None:
         return None
+    return _vwu_from_groups(*match.groups())
 
 
-def row_to_exoplanet(row) -> Exoplanet:
+def parse_value_with_uncertainty_series(series: pd.Series) -> list:
     """
-    Convertit une série pandas (ligne du CSV) en objet Exoplanet.
-    Mappe dynamiquement les colonnes aux champs de la dataclass.
+    Version vectorisée de parse_value_with_uncertainty : la regex est appliquée
+    à toute la colonne via Series.str.extract.
     """
-    exoplanet_data = {}
+    extracted = series.str.strip().str.extract(_VWU_RE)
+    matched = extracted["value"].notna().to_numpy()
+    return [
+        _vwu_from_groups(*groups) if ok else None
+        for ok, groups in zip(matched, extracted.itertuples(index=False, name=None), strict=True)
+    ]
+
+
+def _parse_altname_list(value):
+    """Convertit une liste stockée en string "['a', 'b']" en liste Python."""
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return []
 
-    # Liste des champs attendus dans Exoplanet (pour filtrer ce qu'on envoie au constructeur)
-    # On pourrait utiliser fields(Exoplanet) mais on va faire plus simple :
-    # on itère sur les colonnes du CSV qui matchent les attributs
 
-    # Problème : Le CSV contient TOUT, mais Exoplanet a des types spécifiques.
-    # On doit convertir les ValueWithUncertainty
+def parse_exoplanet_columns(df: pd.DataFrame) -> dict[str, list]:
+    """
+    Prépare colonne par colonne les valeurs attendues par Exoplanet.
 
-    import dataclasses
+    Les masques (ValueWithUncertainty, listes, NaN) sont calculés une seule fois
+    par colonne de façon vectorisée, au lieu de tester chaque cellule de chaque ligne.
 
-    valid_fields = {f.name for f in dataclasses.fields(Exoplanet)}
+    Returns:
+        dict[str, list]: {champ: valeurs converties, indexées par position de ligne}
+    """
+    parsed = {}
 
-    for col, value in row.items():
-        if col not in valid_fields:
+    for col in df.columns:
+        if col not in _EXOPLANET_FIELDS:
             continue
 
-        # Si la valeur est une string ressemblant à l'objet, on parse
-        if isinstance(value, str) and value.startswith("ValueWithUncertainty"):
-            exoplanet_data[col] = parse_value_with_uncertainty(value)
-        # Gestion des listes (pl_altname stocké en string "['a', 'b']")
-        elif col == "pl_altname" and isinstance(value, str) and value.startswith("["):
-            try:
-                exoplanet_data[col] = ast.literal_eval(value)
-            except (ValueError, SyntaxError):
-                exoplanet_data[col] = []
+        series = df[col]
         # Gestion des NaN pour les floats/str
-        elif pd.isna(value):
-            exoplanet_data[col] = None
-        else:
-            exoplanet_data[col] = value
+        values = series.astype(object).where(series.notna(), None)
+
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            # Si la valeur est une string ressemblant à l'objet, on parse
+            vwu_mask = series.str.startswith("ValueWithUncertainty", na=False)
+            if vwu_mask.any():
+                values[vwu_mask] = parse_value_with_uncertainty_series(series[vwu_mask])
+
+            # Gestion des listes (pl_altname stocké en string "['a', 'b']")
+            if col == "pl_altname":
+                list_mask = series.str.startswith("[", na=False)
+                if list_mask.any():
+                    values[list_mask] = series[list_mask].map(_parse_altname_list)
 
-    return Exoplanet(**exoplanet_data)
+        parsed[col] = values.tolist()
 
+    return parsed
 
-@st.cache_data
+
+def row_to_exoplanet(parsed_columns: dict[str, list], position: int) -> Exoplanet:
+    """
+    Construit l'objet Exoplanet de la ligne `position` à partir des colonnes préparées.
+    """
+    return Exoplanet(**{col: values[position] for col, values in parsed_columns.items()})
+
+
+@st.cache_data(show_spinner=False)
 def load_consolidated_data(csv_path):
+    """
+    Charge le CSV consolidé en ne lisant que les colonnes utiles à Exoplanet.
+
+    Le moteur pyarrow (multi-thread) est utilisé s'il est disponible ; les colonnes
+    textuelles sont ensuite ramenées en `object` (NaN pour les vides) afin de garder
+    les mêmes types que le moteur C pour le reste de l'interface.
+    """
     if not os.path.exists(csv_path):
         return None
-    return pd.read_csv(csv_path)
+
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [col for col in header if col in _EXOPLANET_FIELDS]
+    text_cols = [col for col in usecols if col in _TEXT_FIELDS]
+
+    try:
+        df = pd.read_csv(
+            csv_path,
+            engine="pyarrow",
+            usecols=usecols,
+            dtype=dict.fromkeys(text_cols, "string"),
+        )
+    except ImportError:
+        return pd.read_csv(csv_path, usecols=usecols)
+
+    for col in text_cols:
+        df[col] = df[col].astype(object).where(df[col].notna(), float("nan"))
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def load_parsed_columns(csv_path):
+    """
+    Colonnes converties du CSV, calculées une seule fois par fichier.
+
+    Comme l'index des lignes, elles sont en lecture seule et partagées sans copie :
+    un rerun ne désérialise pas à nouveau toutes les colonnes.
+    """
+    df = load_consolidated_data(csv_path)
+    if df is None:
+        return None
+    return parse_exoplanet_columns(df)
+
+
+@st.cache_resource(show_spinner=False)
+def load_row_index(csv_path):
+    """
+    Index des lignes du CSV : position par nom de planète et positions par étoile hôte.
+
+    Chaque sélection devient une recherche par clé au lieu d'un masque booléen sur
+    toute la colonne. L'index est en lecture seule, il est donc partagé sans copie.
+
+    Returns:
+        tuple: ({pl_name: position}, {st_name: [positions]}) ou None
+    """
+    df = load_consolidated_data(csv_path)
+    if df is None:
+        return None
+
+    positions_by_planet = {}
+    for position, name in enumerate(df["pl_name"].tolist()):
+        # Première occurrence, comme l'ancien filtre suivi de iloc[0]
+        positions_by_planet.setdefault(name, position)
+
+    positions_by_star = {
+        star_name: positions.tolist()
+        for star_name, positions in df.groupby("st_name", sort=False).indices.items()
+    }
+    return positions_by_planet, positions_by_star
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_consolidated_csv_files(data_dir: Path) -> list[Path]:
+    """CSV consolidés du plus récent au plus ancien (re-scannés au plus toutes les 30 s)."""
+    if not data_dir.exists():
+        return []
+    with os.scandir(data_dir) as it:
+        entries = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith(".csv")]
+    entries.sort(reverse=True)
+    return [Path(path) for _, path in entries]
 
 
 # --- UI ---
@@ -104,8 +236,7 @@ st.sidebar.header("📁 Données")
 
 # Trouver automatiquement le dernier CSV consolidé
 data_dir = project_root / "data" / "generated" / "consolidated"
-csv_files = list(data_dir.glob("*.csv")) if data_dir.exists() else []
-csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+csv_files = list_consolidated_csv_files(data_dir)
 
 if not csv_files:
     st.error("Aucun fichier de données consolidées trouvé dans `data/generated/consolidated/`.")
@@ -117,8 +248,11 @@ selected_csv = st.sidebar.selectbox("Fichier source", csv_files, format_func=lam
 if selected_csv:
     with st.spinner("Chargement des données..."):
         df = load_consolidated_data(selected_csv)
+        parsed_columns = load_parsed_columns(selected_csv)
+        row_index = load_row_index(selected_csv)
 
     if df is not None:
+        positions_by_planet, positions_by_star = row_index
         st.sidebar.success(f"{len(df)} exoplanètes chargées.")
 
         # Filtres Sidebar
@@ -136,10 +270,11 @@ if selected_csv:
 
         if selected_planet_name:
             # Récupérer la ligne
-            row = filtered_df[filtered_df["pl_name"] == selected_planet_name].iloc[0]
+            row_position = positions_by_planet[selected_planet_name]
+            row = df.iloc[row_position]
 
             # Convertir en objet Exoplanet
-            exoplanet = row_to_exoplanet(row)
+            exoplanet = row_to_exoplanet(parsed_columns, row_position)
 
             # --- MAIN CONTENT ---
             col1, col2 = st.columns([1, 1])
@@ -156,12 +291,14 @@ if selected_csv:
                             # Recherche des frères et soeurs dans le système
                             system_planets = []
                             if exoplanet.st_name:
-                                sys_rows = df[df["st_name"] == exoplanet.st_name]
-                                for _, sys_row in sys_rows.iterrows():
+                                sys_positions = positions_by_star.get(exoplanet.st_name, [])
+                                for sys_position in sys_positions:
                                     if (
-                                        sys_row["pl_name"] != exoplanet.pl_name
+                                        parsed_columns["pl_name"][sys_position] != exoplanet.pl_name
                                     ):  # Exclure soi-même ou pas? draft_util attend la liste pour l'infobox
-                                        system_planets.append(row_to_exoplanet(sys_row))
+                                        system_planets.append(
+                                            row_to_exoplanet(parsed_columns, sys_position)
+                                        )
                                 # On s'inclut soi même généralement dans la liste du système pour l'infobox
                                 system_planets.append(exoplanet)
 
@@ -6,11 +6,25 @@ Usage:
     streamlit run src/ui/kepler20_comparison.py --server.port 8505
 """
 
+import sys
+from dataclasses import dataclass, fields
+from pathlib import Path
+
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
-from dataclasses import dataclass
+from plotly.subplots import make_subplots
+
+# Ajouter la racine du projet au PYTHONPATH pour les imports
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+from src.ui.orbit_math import (  # noqa: E402
+    batch_positions,
+    orbit_key,
+    precompute_orbits,
+)
 
 # Configuration
 st.set_page_config(
@@ -43,6 +57,47 @@ class Planet:
     color: str
 
 
+def planet_hover_html(planet):
+    """Texte de survol d'une planète."""
+    return (
+        f"<b>{planet.name}</b><br>"
+        f"Distance: {planet.semi_major_axis:.4f} AU<br>"
+        f"Période: {planet.orbital_period:.1f} j<br>"
+        f"Rayon: {planet.radius:.3f} R⊕<br>"
+        f"Excentricité: {planet.eccentricity:.4f}<br>"
+        "<extra></extra>"
+    )
+
+
+@dataclass
+class PlanetArrays:
+    """Planètes en structure de tableaux : un tableau NumPy contigu par attribut de Planet."""
+
+    name: np.ndarray
+    semi_major_axis: np.ndarray
+    orbital_period: np.ndarray
+    radius: np.ndarray
+    eccentricity: np.ndarray
+    color: np.ndarray
+    label: np.ndarray  # Nom court ("Kepler-20 b" -> "b")
+    hover_html: np.ndarray
+
+    @classmethod
+    def from_planets(cls, planets):
+        """Convertit une liste de Planet (labels et textes de survol compris)."""
+        return cls(
+            **{f.name: np.array([getattr(p, f.name) for p in planets]) for f in fields(Planet)},
+            label=np.array([p.name.split()[-1] for p in planets]),
+            hover_html=np.array([planet_hover_html(p) for p in planets]),
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def planet_arrays(planets):
+    """PlanetArrays d'une liste de planètes, construit une fois par processus."""
+    return PlanetArrays.from_planets(planets)
+
+
 # --- DONNÉES SYSTÈME SOLAIRE ---
 
 sun = Star("Soleil", 1.0, "#FDB813")
@@ -70,85 +125,73 @@ kepler20_planets = [
 
 # --- FONCTIONS ---
 
+# Demi-grands axes mis à l'échelle de chaque système, par colonne de subplot
+SCALED_A = {
+    subplot_col: precompute_orbits(orbit_key(system_planets))[0]
+    for subplot_col, system_planets in ((1, solar_planets), (2, kepler20_planets))
+}
+
+# Planètes de chaque système en structure de tableaux, par colonne de subplot : les
+# positions de toutes les planètes d'un système sont calculées en une seule passe par frame
+SYSTEM_PLANETS = {
+    1: planet_arrays(solar_planets),
+    2: planet_arrays(kepler20_planets),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def build_orbit_traces(orbit_specs, use_log, subplot_col):
+    """
+    Traces Plotly des orbites (identiques d'une frame à l'autre), construites une fois.
+
+    Args:
+        orbit_specs: Tuple (demi-grand axe, excentricité, couleur) par planète (voir orbit_key)
+        use_log: Échelle logarithmique des distances
+        subplot_col: Colonne du subplot (axes x{col} / y{col})
+    """
+    _, orbits = precompute_orbits(orbit_specs)
+    traces = []
+    for (orbit_x, orbit_y), (_, _, color) in zip(orbits[use_log], orbit_specs, strict=True):
+        traces.append(
+            go.Scatter(
+                x=orbit_x,
+                y=orbit_y,
+                mode="lines",
+                line=dict(color=color, width=1, dash="dot"),
+                showlegend=False,
+                hoverinfo="skip",
+                xaxis=f"x{subplot_col}",
+                yaxis=f"y{subplot_col}",
+            )
+        )
+    return traces
 
-def scale_distance(distance, use_log=True):
-    """Échelle logarithmique pour visualisation."""
-    if use_log:
-        return np.log1p(distance) * 2.5
-    return distance
-
-
-def calculate_position(semi_major_axis, eccentricity, time_fraction):
-    """Position sur orbite elliptique (équation de Kepler)."""
-    M = 2 * np.pi * time_fraction
-    E = M
-    for _ in range(10):
-        E = M + eccentricity * np.sin(E)
-    x = semi_major_axis * (np.cos(E) - eccentricity)
-    y = semi_major_axis * np.sqrt(1 - eccentricity**2) * np.sin(E)
-    return x, y
-
-
-def generate_orbit(semi_major_axis, eccentricity, num_points=200):
-    """Génère les points d'une orbite elliptique."""
-    fractions = np.linspace(0, 1, num_points)
-    positions = [calculate_position(semi_major_axis, eccentricity, t) for t in fractions]
-    return [p[0] for p in positions], [p[1] for p in positions]
-
-
-def create_circle(x, y, radius, color):
-    """Forme de cercle pour Plotly."""
-    return dict(
-        type="circle",
-        xref="x",
-        yref="y",
-        x0=x - radius,
-        y0=y - radius,
-        x1=x + radius,
-        y1=y + radius,
-        fillcolor=color,
-        line=dict(color="white", width=1.5),
-        opacity=0.95,
-    )
+
+# Hauteur de la figure et de sa zone de tracé (marges Plotly par défaut : 100 px en haut, 80 en bas)
+FIGURE_HEIGHT = 700
+PLOT_AREA_HEIGHT = FIGURE_HEIGHT - 100 - 80
+
+
+def marker_size(radius, max_dist):
+    """Diamètre en pixels d'un corps de rayon donné sur un axe [-max_dist, max_dist]."""
+    return radius * PLOT_AREA_HEIGHT / max_dist
 
 
 # --- SESSION STATE ---
 
 if "time_days" not in st.session_state:
     st.session_state.time_days = 0.0
-if "is_playing" not in st.session_state:
-    st.session_state.is_playing = False
 
 
 # --- SIDEBAR ---
 
 st.sidebar.header("🎮 Contrôles")
 
-col1, col2 = st.sidebar.columns(2)
-with col1:
-    if st.button("▶️" if not st.session_state.is_playing else "⏸️", use_container_width=True):
-        st.session_state.is_playing = not st.session_state.is_playing
-with col2:
-    if st.button("🔄 Reset", use_container_width=True):
-        st.session_state.time_days = 0.0
-
-speed = st.sidebar.slider("⚡ Vitesse (jours/frame)", 0.1, 20.0, 5.0, 0.5)
-
 # Temps max basé sur la planète la plus lente
 max_time_solar = solar_planets[-1].orbital_period
 max_time_kepler = kepler20_planets[-1].orbital_period
-max_time = max(max_time_solar, max_time_kepler)
-
-if not st.session_state.is_playing:
-    st.session_state.time_days = st.sidebar.slider(
-        "⏱️ Temps (jours)", 0.0, max_time, st.session_state.time_days, 1.0
-    )
-else:
-    st.sidebar.slider(
-        "⏱️ Temps (jours)", 0.0, max_time, st.session_state.time_days, 1.0, disabled=True
-    )
-
-st.sidebar.markdown("---")
+# float : st.slider refuse de mélanger une borne entière avec un pas flottant
+max_time = float(max(max_time_solar, max_time_kepler))
 
 size_scale = st.sidebar.slider("🔍 Taille des planètes", 1, 100, 30, 5)
 
@@ -162,207 +205,319 @@ st.sidebar.markdown("---")
 show_orbits = st.sidebar.checkbox("Afficher orbites", True)
 show_labels = st.sidebar.checkbox("Afficher labels", True)
 
-st.sidebar.markdown("---")
-st.sidebar.metric("Temps écoulé", f"{st.session_state.time_days:.1f} j")
-st.sidebar.metric("Années terrestres", f"{st.session_state.time_days / 365:.3f}")
-
 
 # --- CRÉATION FIGURE ---
 
+# Nombre maximal de frames envoyées au navigateur (une frame tous les `speed` jours)
+ANIMATION_FRAMES = 240
+
+# Boutons Play/Pause : Plotly joue les frames côté navigateur, sans aucun rerun Streamlit
+ANIMATION_MENU = dict(
+    type="buttons",
+    direction="left",
+    showactive=False,
+    x=0,
+    y=1.08,
+    xanchor="left",
+    yanchor="bottom",
+    bgcolor="rgb(30, 30, 50)",
+    font=dict(color="white"),
+    buttons=[
+        dict(
+            label="▶️",
+            method="animate",
+            args=[
+                None,
+                dict(
+                    frame=dict(duration=50, redraw=True),
+                    transition=dict(duration=0),
+                    fromcurrent=True,
+                    mode="immediate",
+                ),
+            ],
+        ),
+        dict(
+            label="⏸️",
+            method="animate",
+            args=[
+                [None],
+                dict(
+                    frame=dict(duration=0, redraw=False),
+                    transition=dict(duration=0),
+                    mode="immediate",
+                ),
+            ],
+        ),
+    ],
+)
+
+
+def system_extent(planets, subplot_col):
+    """Demi-largeur des axes d'un système."""
+    if planets:
+        return SCALED_A[subplot_col][use_log_scale][-1] * 1.3
+    return 1
+
+
+def animation_frame_count(speed):
+    """Nombre de frames : un cycle complet de max_time, plafonné à ANIMATION_FRAMES."""
+    return min(ANIMATION_FRAMES, int(np.ceil(max_time / speed)))
+
+
+def animation_times(speed):
+    """Instants des frames : depuis le temps courant, tous les `speed` jours, modulo max_time."""
+    n_frames = animation_frame_count(speed)
+    return (st.session_state.time_days + speed * np.arange(n_frames)) % max_time
+
+
+def body_positions(subplot_col, times):
+    """
+    Positions de l'étoile (colonne 0) et des planètes d'un système à chacun des instants donnés.
+
+    Une seule résolution par lot pour tous les instants et toutes les planètes du système.
+
+    Returns:
+        (xs, ys) : tableaux de forme (nombre d'instants, 1 + nombre de planètes)
+    """
+    arrays = SYSTEM_PLANETS[subplot_col]
+    planet_xs, planet_ys = batch_positions(
+        SCALED_A[subplot_col][use_log_scale], arrays.eccentricity, arrays.orbital_period, times
+    )
+    origin = np.zeros((len(planet_xs), 1))
+    return np.hstack((origin, planet_xs)), np.hstack((origin, planet_ys))
+
 
-def create_system_view(star, planets, system_name, subplot_col):
-    """Crée la vue d'un système planétaire."""
-    shapes = []
-    annotations = []
+def create_system_view(star, planets, system_name, subplot_col, xs, ys):
+    """Crée la vue d'un système planétaire, corps placés aux positions (xs, ys)."""
     traces = []
+    arrays = SYSTEM_PLANETS[subplot_col]
+    max_dist = system_extent(planets, subplot_col)
+    radii = np.concatenate(
+        ([star.radius * 0.005 * size_scale], arrays.radius * 0.00005 * size_scale)
+    )
 
-    # Étoile au centre
-    star_radius = star.radius * 0.005 * size_scale
-    shapes.append(create_circle(0, 0, star_radius, star.color))
+    # Orbites (traces mises en cache, seules les planètes bougent d'une frame à l'autre)
+    if show_orbits:
+        traces.extend(build_orbit_traces(orbit_key(planets), use_log_scale, subplot_col))
+
+    # Étoile et planètes : une seule trace WebGL, un marqueur (et son label) par corps
+    traces.append(
+        go.Scattergl(
+            x=xs,
+            y=ys,
+            mode="markers+text" if show_labels else "markers",
+            marker=dict(
+                size=marker_size(radii, max_dist),
+                color=[star.color] + arrays.color.tolist(),
+                line=dict(color="white", width=1.5),
+            ),
+            opacity=0.95,
+            name=system_name,
+            hovertemplate=[f"<b>{star.name}</b><extra></extra>"] + arrays.hover_html.tolist(),
+            xaxis=f"x{subplot_col}",
+            yaxis=f"y{subplot_col}",
+        )
+    )
     if show_labels:
-        annotations.append(
-            dict(
-                x=0,
-                y=star_radius + 0.05,
-                text=star.name,
-                showarrow=False,
-                font=dict(size=12, color="white", family="Arial Black"),
-                xref=f"x{subplot_col}",
-                yref=f"y{subplot_col}",
-            )
+        traces[-1].update(
+            text=[star.name] + arrays.label.tolist(),
+            textposition="top center",
+            textfont=dict(
+                size=[12] + [9] * len(planets),
+                color="white",
+                family=["Arial Black"] + ["Arial"] * len(planets),
+            ),
         )
 
-    # Orbites
-    if show_orbits:
-        for planet in planets:
-            scaled_a = scale_distance(planet.semi_major_axis, use_log_scale)
-            orbit_x, orbit_y = generate_orbit(scaled_a, planet.eccentricity)
-            traces.append(
-                go.Scatter(
-                    x=orbit_x,
-                    y=orbit_y,
-                    mode="lines",
-                    line=dict(color=planet.color, width=1, dash="dot"),
-                    showlegend=False,
-                    hoverinfo="skip",
-                    xaxis=f"x{subplot_col}",
-                    yaxis=f"y{subplot_col}",
-                )
-            )
+    return traces, max_dist
 
-    # Planètes
-    for planet in planets:
-        time_fraction = st.session_state.time_days / planet.orbital_period
-        scaled_a = scale_distance(planet.semi_major_axis, use_log_scale)
-        x, y = calculate_position(scaled_a, planet.eccentricity, time_fraction)
 
-        planet_radius = planet.radius * 0.00005 * size_scale
-        shapes.append(create_circle(x, y, planet_radius, planet.color))
+def figure_title(time_days):
+    """Titre de la figure pour un instant donné."""
+    return (
+        f"Comparaison des systèmes planétaires - {time_days:.0f} jours ({time_days / 365:.3f} ans)"
+    )
 
-        if show_labels:
-            annotations.append(
-                dict(
-                    x=x,
-                    y=y + planet_radius + 0.04,
-                    text=planet.name.split()[-1],
-                    showarrow=False,
-                    font=dict(size=9, color="white"),
-                    xref=f"x{subplot_col}",
-                    yref=f"y{subplot_col}",
-                )
-            )
 
-        # Point invisible pour hover
-        traces.append(
-            go.Scatter(
-                x=[x],
-                y=[y],
-                mode="markers",
-                marker=dict(size=1, color="rgba(0,0,0,0)"),
-                name=planet.name,
-                hovertemplate=f"<b>{planet.name}</b><br>"
-                f"Distance: {planet.semi_major_axis:.4f} AU<br>"
-                f"Période: {planet.orbital_period:.1f} j<br>"
-                f"Rayon: {planet.radius:.3f} R⊕<br>"
-                f"Excentricité: {planet.eccentricity:.4f}<br>"
-                "<extra></extra>",
-                xaxis=f"x{subplot_col}",
-                yaxis=f"y{subplot_col}",
-            )
+def animation_frames(times, positions, bodies_traces):
+    """Frames Plotly : seules les traces des corps et le titre changent d'une frame à l'autre."""
+    return [
+        go.Frame(
+            data=[go.Scattergl(x=xs[k], y=ys[k]) for xs, ys in positions],
+            traces=bodies_traces,
+            name=str(k),
+            layout=dict(title_text=figure_title(t)),
         )
+        for k, t in enumerate(times)
+    ]
 
-    # Calcul limites
-    if planets:
-        max_dist = scale_distance(planets[-1].semi_major_axis, use_log_scale) * 1.3
-    else:
-        max_dist = 1
 
-    return traces, shapes, annotations, max_dist
+def bodies_trace_indices(fig):
+    """Indices des traces des corps (une par système) dans la figure."""
+    return [i for i, trace in enumerate(fig.data) if trace.type == "scattergl"]
 
 
-# --- AFFICHAGE ---
+def create_figure(speed):
+    """Construit la figure complète (orbites, axes, mise en page, corps et frames d'animation)."""
+    # Créer subplot avec 2 colonnes
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=("Système Solaire (4 planètes internes)", "Système Kepler-20 (5 planètes)"),
+        horizontal_spacing=0.1,
+    )
 
-# Créer subplot avec 2 colonnes
-fig = make_subplots(
-    rows=1,
-    cols=2,
-    subplot_titles=("Système Solaire (4 planètes internes)", "Système Kepler-20 (5 planètes)"),
-    horizontal_spacing=0.1,
-)
+    # Positions de tous les corps pour toutes les frames
+    times = animation_times(speed)
+    positions = [body_positions(1, times), body_positions(2, times)]
+    (xs_solar, ys_solar), (xs_kepler, ys_kepler) = positions
 
-# Système Solaire
-traces_solar, shapes_solar, annot_solar, max_dist_solar = create_system_view(
-    sun, solar_planets, "Système Solaire", 1
-)
+    # Système Solaire
+    traces_solar, max_dist_solar = create_system_view(
+        sun, solar_planets, "Système Solaire", 1, xs_solar[0], ys_solar[0]
+    )
 
-# Kepler-20
-traces_kepler, shapes_kepler, annot_kepler, max_dist_kepler = create_system_view(
-    kepler20_star, kepler20_planets, "Kepler-20", 2
-)
+    # Kepler-20
+    traces_kepler, max_dist_kepler = create_system_view(
+        kepler20_star, kepler20_planets, "Kepler-20", 2, xs_kepler[0], ys_kepler[0]
+    )
 
-# Ajouter toutes les traces
-for trace in traces_solar + traces_kepler:
-    fig.add_trace(trace)
-
-# Layout global
-fig.update_layout(
-    shapes=shapes_solar + shapes_kepler,
-    annotations=annot_solar + annot_kepler,
-    showlegend=False,
-    paper_bgcolor="rgb(5, 5, 15)",
-    plot_bgcolor="rgb(10, 10, 25)",
-    font=dict(color="white"),
-    height=700,
-    hovermode="closest",
-    title=dict(
-        text=f"Comparaison des systèmes planétaires - {st.session_state.time_days:.0f} jours ({st.session_state.time_days / 365:.3f} ans)",
-        x=0.5,
-        xanchor="center",
-        font=dict(size=18, color="white"),
-    ),
-)
+    # Ajouter toutes les traces en un seul appel (une seule validation de la figure)
+    fig.add_traces(traces_solar + traces_kepler)
+    fig.frames = animation_frames(times, positions, bodies_trace_indices(fig))
+
+    # Layout global
+    fig.update_layout(
+        showlegend=False,
+        paper_bgcolor="rgb(5, 5, 15)",
+        plot_bgcolor="rgb(10, 10, 25)",
+        font=dict(color="white"),
+        height=FIGURE_HEIGHT,
+        hovermode="closest",
+        title=dict(
+            text=figure_title(st.session_state.time_days),
+            x=0.5,
+            xanchor="center",
+            font=dict(size=18, color="white"),
+        ),
+        updatemenus=[ANIMATION_MENU],
+    )
 
-# Axes système solaire
-fig.update_xaxes(
-    title="X (AU)" if not use_log_scale else "X (AU log)",
-    range=[-max_dist_solar, max_dist_solar],
-    scaleanchor="y",
-    scaleratio=1,
-    showgrid=True,
-    gridcolor="rgba(80,80,80,0.3)",
-    zeroline=True,
-    zerolinecolor="rgba(255,255,255,0.4)",
-    row=1,
-    col=1,
-)
-fig.update_yaxes(
-    title="Y (AU)" if not use_log_scale else "Y (AU log)",
-    range=[-max_dist_solar, max_dist_solar],
-    showgrid=True,
-    gridcolor="rgba(80,80,80,0.3)",
-    zeroline=True,
-    zerolinecolor="rgba(255,255,255,0.4)",
-    row=1,
-    col=1,
-)
+    # Axes système solaire
+    fig.update_xaxes(
+        title="X (AU)" if not use_log_scale else "X (AU log)",
+        range=[-max_dist_solar, max_dist_solar],
+        scaleanchor="y",
+        scaleratio=1,
+        showgrid=True,
+        gridcolor="rgba(80,80,80,0.3)",
+        zeroline=True,
+        zerolinecolor="rgba(255,255,255,0.4)",
+        row=1,
+        col=1,
+    )
+    fig.update_yaxes(
+        title="Y (AU)" if not use_log_scale else "Y (AU log)",
+        range=[-max_dist_solar, max_dist_solar],
+        showgrid=True,
+        gridcolor="rgba(80,80,80,0.3)",
+        zeroline=True,
+        zerolinecolor="rgba(255,255,255,0.4)",
+        row=1,
+        col=1,
+    )
+
+    # Axes Kepler-20
+    fig.update_xaxes(
+        title="X (AU)" if not use_log_scale else "X (AU log)",
+        range=[-max_dist_kepler, max_dist_kepler],
+        scaleanchor="y2",
+        scaleratio=1,
+        showgrid=True,
+        gridcolor="rgba(80,80,80,0.3)",
+        zeroline=True,
+        zerolinecolor="rgba(255,255,255,0.4)",
+        row=1,
+        col=2,
+    )
+    fig.update_yaxes(
+        title="Y (AU)" if not use_log_scale else "Y (AU log)",
+        range=[-max_dist_kepler, max_dist_kepler],
+        showgrid=True,
+        gridcolor="rgba(80,80,80,0.3)",
+        zeroline=True,
+        zerolinecolor="rgba(255,255,255,0.4)",
+        row=1,
+        col=2,
+    )
+
+    return fig
+
+
+def update_figure(fig, speed):
+    """Recale sur place les corps, le titre et les frames sur le temps courant et la vitesse."""
+    times = animation_times(speed)
+    positions = [body_positions(1, times), body_positions(2, times)]
+
+    with fig.batch_update():
+        fig.layout.title.text = figure_title(st.session_state.time_days)
+        bodies = fig.select_traces(selector=dict(type="scattergl"))
+        for trace, (xs, ys) in zip(bodies, positions, strict=True):
+            trace.x, trace.y = xs[0], ys[0]
+    fig.frames = animation_frames(times, positions, bodies_trace_indices(fig))
+
+
+# --- AFFICHAGE ---
+
+
+@st.fragment
+def render_systems():
+    """
+    Contrôles de temps et graphique, isolés dans un fragment.
+
+    Déplacer le temps ou changer la vitesse ne réexécute que ce bloc ; les réglages
+    de la sidebar (taille, échelle, orbites, labels) relancent toujours la page entière.
+    """
+    col_reset, col_speed, col_time, col_years = st.columns([1, 3, 6, 2])
+    with col_reset:
+        if st.button("🔄", use_container_width=True):
+            st.session_state.time_days = 0.0
+    with col_speed:
+        speed = st.slider("⚡ Vitesse (jours/frame)", 0.1, 20.0, 5.0, 0.5)
+    with col_time:
+        st.session_state.time_days = st.slider(
+            "⏱️ Départ (jours)",
+            0.0,
+            max_time,
+            st.session_state.time_days,
+            1.0,
+            help="Instant de départ de l'animation : il ne suit pas la lecture (voir le titre)",
+        )
+    with col_years:
+        st.metric("Années (départ)", f"{st.session_state.time_days / 365:.3f}")
+
+    # La figure n'est reconstruite que si un réglage d'affichage change ; un changement
+    # de temps ou de vitesse ne fait que recaler les corps et les frames sur la figure conservée
+    figure_settings = (size_scale, use_log_scale, show_orbits, show_labels)
+    if st.session_state.get("figure_settings") != figure_settings:
+        st.session_state.fig = create_figure(speed)
+        st.session_state.figure_settings = figure_settings
+    else:
+        update_figure(st.session_state.fig, speed)
+
+    # Affichage (clé stable : le graphique existant est mis à jour plutôt que recréé)
+    st.plotly_chart(st.session_state.fig, key="systems_chart", use_container_width=True)
+
+    # Les frames sont jouées par le navigateur : la lecture couvre une fenêtre finie
+    # et s'arrête à sa fin, sans mettre à jour le curseur de départ
+    window = animation_frame_count(speed) * speed
+    st.caption(
+        f"▶️ joue {window:.0f} jours à partir du départ, puis s'arrête. L'instant affiché "
+        "est dans le titre du graphique ; déplacez le départ pour voir la suite."
+    )
 
-# Axes Kepler-20
-fig.update_xaxes(
-    title="X (AU)" if not use_log_scale else "X (AU log)",
-    range=[-max_dist_kepler, max_dist_kepler],
-    scaleanchor="y2",
-    scaleratio=1,
-    showgrid=True,
-    gridcolor="rgba(80,80,80,0.3)",
-    zeroline=True,
-    zerolinecolor="rgba(255,255,255,0.4)",
-    row=1,
-    col=2,
-)
-fig.update_yaxes(
-    title="Y (AU)" if not use_log_scale else "Y (AU log)",
-    range=[-max_dist_kepler, max_dist_kepler],
-    showgrid=True,
-    gridcolor="rgba(80,80,80,0.3)",
-    zeroline=True,
-    zerolinecolor="rgba(255,255,255,0.4)",
-    row=1,
-    col=2,
-)
 
-# Affichage
-chart_placeholder = st.empty()
-
-if st.session_state.is_playing:
-    st.session_state.time_days += speed
-    if st.session_state.time_days >= max_time:
-        st.session_state.time_days = 0.0
-    with chart_placeholder.container():
-        st.plotly_chart(fig, use_container_width=True)
-    st.rerun()
-else:
-    with chart_placeholder.container():
-        st.plotly_chart(fig, use_container_width=True)
+render_systems()
 
 
 # --- TABLEAU COMPARATIF ---
@@ -0,0 +1,204 @@
+# src/ui/orbit_math.py
+"""
+Mécanique orbitale partagée par les vues Streamlit (prototype_3d, kepler20_comparison).
+
+Responsabilité :
+- Résoudre l'équation de Kepler (Meeus, Markley) de façon vectorisée
+- Calculer les positions des planètes, par instant ou par lot d'instants
+- Générer et mettre en cache les orbites tracées
+
+Module importé (et non réexécuté) à chaque rerun Streamlit : les caches
+functools survivent donc d'un rerun à l'autre.
+"""
+
+from functools import cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel : repli sur la résolution NumPy vectorisée
+    njit = None
+
+# Sous ce seuil (toutes les planètes affichées), Meeus + un pas de Newton suffit
+LOW_ECCENTRICITY = 0.3
+
+# Orbites quasi circulaires : E = M + e·sin(M) est exact à e²/2 près (< 5e-7 rad)
+CIRCULAR_ECCENTRICITY = 1e-3
+
+
+def scale_distance(distance, use_log=True):
+    """Applique échelle logarithmique si activée."""
+    if use_log:
+        return np.log1p(distance) * 2.5
+    return distance
+
+
+def shift_sin_cos(sin_e, cos_e, delta):
+    """sin et cos de E + delta à partir de ceux de E, pour une petite correction delta."""
+    delta2 = delta * delta
+    sin_d = delta * (1 - delta2 / 6 * (1 - delta2 / 20))
+    cos_d = 1 - delta2 / 2 * (1 - delta2 / 12)
+    return sin_e * cos_d + cos_e * sin_d, cos_e * cos_d - sin_e * sin_d
+
+
+def solve_kepler(mean_anomaly, eccentricity):
+    """
+    Résout l'équation de Kepler M = E - e·sin(E), scalaire ou tableau NumPy (M et e).
+
+    Faible excentricité : estimation de Meeus atan2(sin M, cos M - e) corrigée par un
+    seul pas de Newton (erreur < 1e-6 rad pour e < 0.3). sin(E) et cos(E) de l'estimation
+    se déduisent de sin M et cos M, puis sont décalés de la correction : 3 évaluations
+    trigonométriques en tout. Au-delà, repli sur la méthode de Markley. Orbite quasi
+    circulaire : un seul terme E = M + e·sin(M), soit 2 évaluations (sin M et cos M).
+
+    Returns:
+        (E, sin E, cos E)
+    """
+    if np.all(eccentricity < CIRCULAR_ECCENTRICITY):
+        sin_m, cos_m = np.sin(mean_anomaly), np.cos(mean_anomaly)
+        delta = eccentricity * sin_m
+        return (mean_anomaly + delta, *shift_sin_cos(sin_m, cos_m, delta))
+    if np.all(eccentricity < LOW_ECCENTRICITY):
+        # atan2 renvoie E dans [-π, π] : M doit être ramené dans le même intervalle
+        M = np.remainder(mean_anomaly + np.pi, 2 * np.pi) - np.pi
+        opposite, adjacent = np.sin(M), np.cos(M) - eccentricity
+        E = np.arctan2(opposite, adjacent)
+        norm = np.hypot(opposite, adjacent)
+        sin_e, cos_e = opposite / norm, adjacent / norm
+        delta = -(E - eccentricity * sin_e - M) / (1 - eccentricity * cos_e)
+        return (E + delta, *shift_sin_cos(sin_e, cos_e, delta))
+    return solve_kepler_markley(mean_anomaly, eccentricity)
+
+
+def solve_kepler_markley(mean_anomaly, eccentricity):
+    """
+    Résout l'équation de Kepler M = E - e·sin(E) sans itération (Markley, 1995).
+
+    Estimation analytique (cubique) puis une correction d'ordre 5 : précision machine
+    pour 0 <= e < 1, scalaire ou tableau NumPy.
+
+    Returns:
+        (E, sin E, cos E)
+    """
+    # Ramener M dans [-π, π) : l'estimation de Markley est impaire en M
+    M = np.remainder(mean_anomaly + np.pi, 2 * np.pi) - np.pi
+    e = eccentricity
+
+    alpha = (3 * np.pi**2 + 1.6 * np.pi * (np.pi - np.abs(M)) / (1 + e)) / (np.pi**2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - M**2
+    r = 3 * alpha * d * (d - 1 + e) * M + M**3
+    w = (np.abs(r) + np.sqrt(q**3 + r**2)) ** (2 / 3)
+    E = (2 * r * w / (w**2 + w * q + q**2) + M) / d
+
+    # Correction d'ordre 5 à partir de sin(E) et cos(E), calculés une seule fois
+    sin_e, cos_e = np.sin(E), np.cos(E)
+    f0 = E - e * sin_e - M
+    f1 = 1 - e * cos_e
+    f2 = e * sin_e
+    f3 = 1 - f1
+    d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+    d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3**2 * f3 / 6)
+    d5 = -f0 / (f1 + 0.5 * d4 * f2 + d4**2 * f3 / 6 - d4**3 * f2 / 24)
+    return (E + d5, *shift_sin_cos(sin_e, cos_e, d5))
+
+
+def calculate_position(semi_major_axis, eccentricity, time_fraction):
+    """Position sur orbite elliptique (équation de Kepler), scalaire ou tableau NumPy."""
+    M = 2 * np.pi * time_fraction
+    _, sin_e, cos_e = solve_kepler(M, eccentricity)
+    x = semi_major_axis * (cos_e - eccentricity)
+    y = semi_major_axis * np.sqrt(1 - eccentricity**2) * sin_e
+    return x, y
+
+
+if njit is not None:
+
+    @njit(fastmath=True)
+    def _jit_kepler_positions(semi_major_axis, eccentricity, orbital_period, times):
+        """
+        Noyau numba des positions par lot (instants × planètes), compilé au premier appel.
+
+        Boucle compilée sur les instants puis les planètes, chacune résolue par la forme
+        sans branche de Markley (voir solve_kepler_markley), sans tableau intermédiaire.
+        """
+        xs = np.empty((times.size, semi_major_axis.size))
+        ys = np.empty_like(xs)
+        for k in range(times.size):
+            for j in range(semi_major_axis.size):
+                e = eccentricity[j]
+                M = (2 * np.pi * times[k] / orbital_period[j] + np.pi) % (2 * np.pi) - np.pi
+                alpha = (3 * np.pi**2 + 1.6 * np.pi * (np.pi - abs(M)) / (1 + e)) / (np.pi**2 - 6)
+                d = 3 * (1 - e) + alpha * e
+                q = 2 * alpha * d * (1 - e) - M**2
+                r = 3 * alpha * d * (d - 1 + e) * M + M**3
+                w = (abs(r) + np.sqrt(q**3 + r**2)) ** (2 / 3)
+                E = (2 * r * w / (w**2 + w * q + q**2) + M) / d
+                f0 = E - e * np.sin(E) - M
+                f1 = 1 - e * np.cos(E)
+                f2 = e * np.sin(E)
+                f3 = 1 - f1
+                d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+                d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3**2 * f3 / 6)
+                E += -f0 / (f1 + 0.5 * d4 * f2 + d4**2 * f3 / 6 - d4**3 * f2 / 24)
+                xs[k, j] = semi_major_axis[j] * (np.cos(E) - e)
+                ys[k, j] = semi_major_axis[j] * np.sqrt(1 - e**2) * np.sin(E)
+        return xs, ys
+
+else:
+    _jit_kepler_positions = None
+
+
+def batch_positions(semi_major_axis, eccentricity, orbital_period, times):
+    """
+    Positions (x, y) de chaque planète à chaque instant, tableaux (instants, planètes).
+
+    Noyau numba si disponible, sinon une seule résolution NumPy vectorisée.
+    """
+    times = np.asarray(times, dtype=float)
+    if _jit_kepler_positions is not None:
+        return _jit_kepler_positions(semi_major_axis, eccentricity, orbital_period, times)
+    return calculate_position(semi_major_axis, eccentricity, times[:, None] / orbital_period)
+
+
+def generate_orbit(semi_major_axis, eccentricity, num_points=200):
+    """Génère les points d'une orbite elliptique (résolution vectorisée sur tous les points)."""
+    # Le dernier point du tracé reprend le premier (t = 0 et t = 1) au lieu d'être résolu à
+    # nouveau ; float32 suffit à l'affichage et divise par deux les tableaux envoyés à Plotly
+    fractions = np.linspace(0, 1, num_points - 1, endpoint=False)
+    x, y = calculate_position(semi_major_axis, eccentricity, fractions)
+    closed = np.append(np.arange(num_points - 1), 0)
+    return x[closed].astype(np.float32), y[closed].astype(np.float32)
+
+
+def orbit_key(planets):
+    """Clé hashable décrivant les orbites d'une liste de planètes."""
+    return tuple((p.semi_major_axis, p.eccentricity, p.color) for p in planets)
+
+
+@cache
+def precompute_orbits(orbit_specs):
+    """
+    Demi-grands axes mis à l'échelle et orbites, pour les deux échelles, calculés une fois.
+
+    Ne dépendent que des données des planètes : l'animation n'a plus qu'à les lire.
+    Le résultat est partagé entre les appels et ne doit pas être modifié.
+
+    Args:
+        orbit_specs: Tuple (demi-grand axe, excentricité, couleur) par planète (voir orbit_key)
+
+    Returns:
+        (scaled_a, orbits) : dictionnaires indexés par use_log, donnant le tableau des
+        demi-grands axes mis à l'échelle et la liste des orbites (x, y) par planète
+    """
+    semi_major_axes = np.array([a for a, _, _ in orbit_specs])
+    scaled_a = {}
+    orbits = {}
+    for use_log in (True, False):
+        scaled_a[use_log] = scale_distance(semi_major_axes, use_log)
+        orbits[use_log] = [
+            generate_orbit(a, e)
+            for a, (_, e, _) in zip(scaled_a[use_log], orbit_specs, strict=True)
+        ]
+    return scaled_a, orbits
@@ -11,10 +11,24 @@ Usage:
     streamlit run src/ui/prototype_3d.py
 """
 
+import sys
+from dataclasses import dataclass, fields
+from pathlib import Path
+
 import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
-from dataclasses import dataclass
+
+# Ajouter la racine du projet au PYTHONPATH pour les imports
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+from src.ui.orbit_math import (  # noqa: E402
+    batch_positions,
+    orbit_key,
+    precompute_orbits,
+)
 
 # Configuration
 st.set_page_config(
@@ -46,6 +60,44 @@ class Planet:
     color: str
 
 
+def planet_hover_html(planet):
+    """Texte de survol d'une planète."""
+    return (
+        f"<b>{planet.name}</b><br>"
+        f"Distance: {planet.semi_major_axis:.3f} AU<br>"
+        f"Excentricité: {planet.eccentricity:.4f}<br>"
+        f"Période: {planet.orbital_period} j<br>"
+        f"Rayon: {planet.radius:.3f} R⊕<br>"
+        "<extra></extra>"
+    )
+
+
+@dataclass
+class PlanetArrays:
+    """Planètes en structure de tableaux : un tableau NumPy contigu par attribut de Planet."""
+    name: np.ndarray
+    semi_major_axis: np.ndarray
+    orbital_period: np.ndarray
+    radius: np.ndarray
+    eccentricity: np.ndarray
+    color: np.ndarray
+    hover_html: np.ndarray
+
+    @classmethod
+    def from_planets(cls, planets):
+        """Convertit une liste de Planet (textes de survol compris)."""
+        return cls(
+            **{f.name: np.array([getattr(p, f.name) for p in planets]) for f in fields(Planet)},
+            hover_html=np.array([planet_hover_html(p) for p in planets]),
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def planet_arrays(planets):
+    """PlanetArrays d'une liste de planètes, construit une fois par processus."""
+    return PlanetArrays.from_planets(planets)
+
+
 # --- DONNÉES ---
 
 sun = Star("Soleil", 1.0, "#FDB813")
@@ -64,71 +116,57 @@ planets = [
 
 # --- FONCTIONS ---
 
-def scale_distance(distance, use_log=True):
-    """Applique échelle logarithmique si activée."""
-    if use_log:
-        return np.log1p(distance) * 2.5
-    return distance
-
-
-def calculate_position(semi_major_axis, eccentricity, time_fraction):
-    """Position sur orbite elliptique (Kepler)."""
-    M = 2 * np.pi * time_fraction
-    E = M
-    for _ in range(10):
-        E = M + eccentricity * np.sin(E)
-    x = semi_major_axis * (np.cos(E) - eccentricity)
-    y = semi_major_axis * np.sqrt(1 - eccentricity**2) * np.sin(E)
-    return x, y
-
-
-def generate_orbit(semi_major_axis, eccentricity, num_points=200):
-    """Génère orbite elliptique."""
-    fractions = np.linspace(0, 1, num_points)
-    positions = [calculate_position(semi_major_axis, eccentricity, t) for t in fractions]
-    return [p[0] for p in positions], [p[1] for p in positions]
-
-
-def create_circle(x, y, radius, color):
-    """Cercle plein."""
-    return dict(
-        type="circle", xref="x", yref="y",
-        x0=x-radius, y0=y-radius, x1=x+radius, y1=y+radius,
-        fillcolor=color, line=dict(color="white", width=2), opacity=0.95
-    )
+SCALED_A, _ = precompute_orbits(orbit_key(planets))
+
+# Planètes en structure de tableaux : les positions de toutes les planètes sont
+# calculées en une seule résolution vectorisée par frame
+PLANETS = planet_arrays(planets)
+
+
+@st.cache_resource(show_spinner=False)
+def build_orbit_traces(orbit_specs, visible_indices, use_log):
+    """
+    Traces Plotly des orbites, construites une fois par jeu de planètes et d'échelle.
+
+    Args:
+        orbit_specs: Tuple (demi-grand axe, excentricité, couleur) par planète (voir orbit_key)
+        visible_indices: Indices des planètes affichées
+        use_log: Échelle logarithmique des distances
+    """
+    _, orbits = precompute_orbits(orbit_specs)
+    traces = []
+    for i in visible_indices:
+        orbit_x, orbit_y = orbits[use_log][i]
+        color = orbit_specs[i][2]
+        traces.append(go.Scatter(
+            x=orbit_x, y=orbit_y, mode="lines",
+            line=dict(color=color, width=1, dash="dot"),
+            showlegend=False, hoverinfo="skip"
+        ))
+    return traces
+
+
+# Hauteur de la figure et de sa zone de tracé (marges Plotly par défaut : 100 px en haut, 80 en bas)
+FIGURE_HEIGHT = 700
+PLOT_AREA_HEIGHT = FIGURE_HEIGHT - 100 - 80
+
+
+def marker_size(radius, max_dist):
+    """Diamètre en pixels d'un corps de rayon donné sur un axe [-max_dist, max_dist]."""
+    return radius * PLOT_AREA_HEIGHT / max_dist
 
 
 # --- SESSION STATE ---
 
 if "time_days" not in st.session_state:
     st.session_state.time_days = 0.0
-if "is_playing" not in st.session_state:
-    st.session_state.is_playing = False
 
 
 # --- SIDEBAR ---
 
 st.sidebar.header("🎮 Contrôles")
 
-col1, col2 = st.sidebar.columns(2)
-with col1:
-    if st.button("▶️" if not st.session_state.is_playing else "⏸️", use_container_width=True):
-        st.session_state.is_playing = not st.session_state.is_playing
-with col2:
-    if st.button("🔄", use_container_width=True):
-        st.session_state.time_days = 0.0
-
-speed = st.sidebar.slider("⚡ Vitesse", 0.1, 50.0, 10.0, 0.5)
-
 max_time = float(planets[-1].orbital_period)
-if not st.session_state.is_playing:
-    st.session_state.time_days = st.sidebar.slider(
-        "⏱️ Temps (jours)", 0.0, max_time, st.session_state.time_days, 10.0
-    )
-else:
-    st.sidebar.slider("⏱️ Temps (jours)", 0.0, max_time, st.session_state.time_days, 10.0, disabled=True)
-
-st.sidebar.markdown("---")
 
 size_scale = st.sidebar.slider("🔍 Tailles", 1, 200, 50, 5)
 
@@ -148,76 +186,123 @@ st.sidebar.markdown("---")
 show_orbits = st.sidebar.checkbox("Orbites", True)
 show_labels = st.sidebar.checkbox("Labels", True)
 
-st.sidebar.markdown("---")
-st.sidebar.metric("Temps", f"{st.session_state.time_days:.0f} j")
-st.sidebar.metric("Années", f"{st.session_state.time_days/365:.2f}")
-
 
 # --- CRÉATION FIGURE ---
 
-def create_view():
+# Nombre maximal de frames envoyées au navigateur (une frame tous les `speed` jours)
+ANIMATION_FRAMES = 240
+
+# Boutons Play/Pause : Plotly joue les frames côté navigateur, sans aucun rerun Streamlit
+ANIMATION_MENU = dict(
+    type="buttons", direction="left", showactive=False,
+    x=0, y=1.02, xanchor="left", yanchor="bottom",
+    bgcolor="rgb(30, 30, 50)", font=dict(color="white"),
+    buttons=[
+        dict(label="▶️", method="animate", args=[None, dict(
+            frame=dict(duration=50, redraw=True), transition=dict(duration=0),
+            fromcurrent=True, mode="immediate"
+        )]),
+        dict(label="⏸️", method="animate", args=[[None], dict(
+            frame=dict(duration=0, redraw=False), transition=dict(duration=0), mode="immediate"
+        )]),
+    ]
+)
+
+
+def view_extent(visible_indices):
+    """Demi-largeur des axes de la vue."""
+    if visible_indices:
+        return SCALED_A[use_log_scale][visible_indices[-1]] * 1.2
+    return 10
+
+
+def animation_frame_count(speed):
+    """Nombre de frames : un cycle complet de max_time, plafonné à ANIMATION_FRAMES."""
+    return min(ANIMATION_FRAMES, int(np.ceil(max_time / speed)))
+
+
+def animation_times(speed):
+    """Instants des frames : depuis le temps courant, tous les `speed` jours, modulo max_time."""
+    return (st.session_state.time_days + speed * np.arange(animation_frame_count(speed))) % max_time
+
+
+def body_positions(visible_indices, times):
+    """
+    Positions du Soleil (colonne 0) et des planètes à chacun des instants donnés.
+
+    Une seule résolution par lot pour tous les instants et toutes les planètes.
+
+    Returns:
+        (xs, ys) : tableaux de forme (nombre d'instants, 1 + nombre de planètes)
+    """
+    idx = list(visible_indices)
+    planet_xs, planet_ys = batch_positions(
+        SCALED_A[use_log_scale][idx], PLANETS.eccentricity[idx], PLANETS.orbital_period[idx], times
+    )
+    origin = np.zeros((len(planet_xs), 1))
+    return np.hstack((origin, planet_xs)), np.hstack((origin, planet_ys))
+
+
+def view_title(time_days):
+    """Titre de la vue pour un instant donné."""
+    return (
+        f"Système Solaire - {time_days:.0f} j "
+        f"({time_days/365:.2f} ans) | {'Log' if use_log_scale else 'Lin'}"
+    )
+
+
+def animation_frames(times, xs, ys, bodies_trace):
+    """Frames Plotly : seules la trace des corps et le titre changent d'une frame à l'autre."""
+    return [
+        go.Frame(
+            data=[go.Scattergl(x=x, y=y)], traces=[bodies_trace], name=str(k),
+            layout=dict(title_text=view_title(t))
+        )
+        for k, (t, x, y) in enumerate(zip(times, xs, ys, strict=True))
+    ]
+
+
+def create_view(visible_indices, speed):
     fig = go.Figure()
-    shapes = []
-    annotations = []
-    
-    # Soleil
-    sun_radius = sun.radius * 0.00465 * size_scale
-    shapes.append(create_circle(0, 0, sun_radius, sun.color))
-    if show_labels:
-        annotations.append(dict(
-            x=0, y=sun_radius+0.1, text=sun.name, showarrow=False,
-            font=dict(size=14, color="white", family="Arial Black")
-        ))
-    
-    # Planètes filtrées
-    visible_planets = [p for p in planets if p.name in planet_filter]
-    
-    # Orbites
+    idx = list(visible_indices)
+    max_dist = view_extent(visible_indices)
+    times = animation_times(speed)
+    xs, ys = body_positions(visible_indices, times)
+    radii = np.concatenate((
+        [sun.radius * 0.00465 * size_scale], PLANETS.radius[idx] * 0.0000426 * size_scale
+    ))
+
+    # Orbites (traces mises en cache, seules les planètes bougent d'une frame à l'autre)
+    traces = []
     if show_orbits:
-        for planet in visible_planets:
-            scaled_a = scale_distance(planet.semi_major_axis, use_log_scale)
-            orbit_x, orbit_y = generate_orbit(scaled_a, planet.eccentricity)
-            fig.add_trace(go.Scatter(
-                x=orbit_x, y=orbit_y, mode="lines",
-                line=dict(color=planet.color, width=1, dash="dot"),
-                showlegend=False, hoverinfo="skip"
-            ))
-    
-    # Planètes
-    for planet in visible_planets:
-        time_fraction = st.session_state.time_days / planet.orbital_period
-        scaled_a = scale_distance(planet.semi_major_axis, use_log_scale)
-        x, y = calculate_position(scaled_a, planet.eccentricity, time_fraction)
-        
-        planet_radius = planet.radius * 0.0000426 * size_scale
-        shapes.append(create_circle(x, y, planet_radius, planet.color))
-        
-        if show_labels:
-            annotations.append(dict(
-                x=x, y=y+planet_radius+0.08, text=planet.name,
-                showarrow=False, font=dict(size=11, color="white")
-            ))
-        
-        fig.add_trace(go.Scatter(
-            x=[x], y=[y], mode="markers",
-            marker=dict(size=1, color="rgba(0,0,0,0)"),
-            name=planet.name,
-            hovertemplate=f"<b>{planet.name}</b><br>"
-                         f"Distance: {planet.semi_major_axis:.3f} AU<br>"
-                         f"Excentricité: {planet.eccentricity:.4f}<br>"
-                         f"Période: {planet.orbital_period} j<br>"
-                         f"Rayon: {planet.radius:.3f} R⊕<br>"
-                         "<extra></extra>"
-        ))
-    
+        traces.extend(build_orbit_traces(orbit_key(planets), visible_indices, use_log_scale))
+
+    # Soleil et planètes : une seule trace WebGL, un marqueur (et son label) par corps
+    traces.append(go.Scattergl(
+        x=xs[0], y=ys[0], mode="markers+text" if show_labels else "markers",
+        marker=dict(
+            size=marker_size(radii, max_dist),
+            color=[sun.color] + PLANETS.color[idx].tolist(),
+            line=dict(color="white", width=2)
+        ),
+        opacity=0.95,
+        hovertemplate=[f"<b>{sun.name}</b><extra></extra>"] + PLANETS.hover_html[idx].tolist()
+    ))
+    if show_labels:
+        traces[-1].update(
+            text=[sun.name] + PLANETS.name[idx].tolist(), textposition="top center",
+            textfont=dict(
+                size=[14] + [11] * len(idx), color="white",
+                family=["Arial Black"] + ["Arial"] * len(idx)
+            )
+        )
+
+    # Toutes les traces en un seul appel (une seule validation de la figure)
+    fig.add_traces(traces)
+    fig.frames = animation_frames(times, xs, ys, len(fig.data) - 1)
+
     # Layout
-    if visible_planets:
-        max_dist = scale_distance(visible_planets[-1].semi_major_axis, use_log_scale) * 1.2
-    else:
-        max_dist = 10
-    
     fig.update_layout(
-        shapes=shapes, annotations=annotations,
         xaxis=dict(
             title="X (AU log)" if use_log_scale else "X (AU)",
             range=[-max_dist, max_dist], scaleanchor="y", scaleratio=1,
@@ -231,36 +316,80 @@ def create_view():
             zeroline=True, zerolinecolor="rgba(255,255,255,0.4)"
         ),
         title=dict(
-            text=f"Système Solaire - {st.session_state.time_days:.0f} j ({st.session_state.time_days/365:.2f} ans) | {'Log' if use_log_scale else 'Lin'}",
+            text=view_title(st.session_state.time_days),
             x=0.5, xanchor="center", font=dict(size=16, color="white")
         ),
+        updatemenus=[ANIMATION_MENU],
         showlegend=False,
         paper_bgcolor="rgb(5, 5, 15)",
         plot_bgcolor="rgb(10, 10, 25)",
         font=dict(color="white"),
-        height=700,
+        height=FIGURE_HEIGHT,
         hovermode="closest"
     )
-    
+
     return fig
 
 
+def update_view(fig, visible_indices, speed):
+    """Recale sur place les corps, le titre et les frames sur le temps courant et la vitesse."""
+    times = animation_times(speed)
+    xs, ys = body_positions(visible_indices, times)
+
+    with fig.batch_update():
+        fig.layout.title.text = view_title(st.session_state.time_days)
+        fig.update_traces(selector=dict(type="scattergl"), x=xs[0], y=ys[0])
+    fig.frames = animation_frames(times, xs, ys, len(fig.data) - 1)
+
+
 # --- AFFICHAGE ---
 
-chart_placeholder = st.empty()
-
-if st.session_state.is_playing:
-    st.session_state.time_days += speed
-    if st.session_state.time_days >= max_time:
-        st.session_state.time_days = 0.0
-    with chart_placeholder.container():
-        fig = create_view()
-        st.plotly_chart(fig, use_container_width=True)
-    st.rerun()
-else:
-    with chart_placeholder.container():
-        fig = create_view()
-        st.plotly_chart(fig, use_container_width=True)
+@st.fragment
+def render_view(visible_indices):
+    """
+    Contrôles de temps et graphique, isolés dans un fragment.
+
+    Déplacer le temps ou changer la vitesse ne relance que ce fragment : ni la barre
+    latérale ni les métriques ne sont réexécutées. Les réglages de la barre latérale,
+    qui changent la géométrie, relancent toujours tout le script.
+    """
+    col_reset, col_speed, col_time, col_years = st.columns([1, 3, 6, 2])
+    with col_reset:
+        if st.button("🔄", use_container_width=True):
+            st.session_state.time_days = 0.0
+    with col_speed:
+        speed = st.slider("⚡ Vitesse", 0.1, 50.0, 10.0, 0.5)
+    with col_time:
+        st.session_state.time_days = st.slider(
+            "⏱️ Départ (jours)", 0.0, max_time, st.session_state.time_days, 10.0,
+            help="Instant de départ de l'animation : il ne suit pas la lecture (voir le titre du graphique)",
+        )
+    with col_years:
+        st.metric("Années (départ)", f"{st.session_state.time_days/365:.2f}")
+
+    # La figure n'est reconstruite que si un réglage d'affichage change ; un changement
+    # de temps ou de vitesse ne fait que recaler les corps et les frames sur la figure conservée
+    view_settings = (size_scale, use_log_scale, visible_indices, show_orbits, show_labels)
+    if st.session_state.get("view_settings") != view_settings:
+        st.session_state.fig = create_view(visible_indices, speed)
+        st.session_state.view_settings = view_settings
+    else:
+        update_view(st.session_state.fig, visible_indices, speed)
+
+    # Clé stable : le graphique existant est mis à jour plutôt que recréé
+    st.plotly_chart(st.session_state.fig, key="solar_system_chart", use_container_width=True)
+
+    # Les frames sont jouées par le navigateur : la lecture couvre une fenêtre finie
+    # et s'arrête à sa fin, sans mettre à jour le curseur de départ
+    window = animation_frame_count(speed) * speed
+    st.caption(
+        f"▶️ joue {window:.0f} jours à partir du départ ({window/365:.1f} ans), puis s'arrête. "
+        "L'instant affiché est dans le titre du graphique ; déplacez le départ pour voir la suite."
+    )
+
+
+# Planètes filtrées
+render_view(tuple(i for i, p in enumerate(planets) if p.name in planet_filter))
 
 # Métriques
 st.markdown("---")
@@ -273,6 +402,8 @@ st.info("""
 **💡 Utilisation :**
 - **Échelle logarithmique** : Active pour voir toutes les planètes ensemble
 - **Filtre planètes** : Sélectionne les planètes à afficher
-- **▶️** : Lance l'animation
-- **Vitesse** : Contrôle la rapidité (jours par frame)
+- **▶️ / ⏸️** (sur le graphique) : Lance / met en pause l'animation, jouée dans le navigateur
+  sur au plus 240 frames à partir de l'instant de départ
+- **Départ** : Instant de départ de l'animation (le titre du graphique indique l'instant affiché)
+- **Vitesse** (au-dessus du graphique) : Contrôle la rapidité (jours par frame)
 """)
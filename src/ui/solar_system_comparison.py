@@ -3,8 +3,12 @@ Visualisation comparative du système solaire avec matplotlib
 Affiche deux vues : échelle compressée et échelle quasi-réelle
 """
 
+import math
+from functools import cache
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PatchCollection
 
 # -----------------------------
 # Data definition (real radii in km)
@@ -85,22 +89,26 @@ bodies = [
 ]
 
 
+_BODIES_BY_ID = {body["id"]: body for body in bodies}
+
+
 # -----------------------------
 # Color functions
 # -----------------------------
 def blackbody_color(temp_k: float) -> tuple[float, float, float]:
     """Approximate blackbody color (RGB normalized 0-1)."""
-    t = np.clip(temp_k / 100.0, 10, 400)
+    # Scalar input: plain min/max and math avoid wrapping every value in a 0-d ndarray
+    t = max(10.0, min(400.0, temp_k / 100.0))
     if t <= 66:
         r = 255
-        g = np.clip(99.47 * np.log(t) - 161.12, 0, 255)
+        g = max(0.0, min(255.0, 99.47 * math.log(t) - 161.12))
         if t <= 19:
             b = 0
         else:
-            b = np.clip(138.52 * np.log(t - 10) - 305.04, 0, 255)
+            b = max(0.0, min(255.0, 138.52 * math.log(t - 10) - 305.04))
     else:
-        r = np.clip(329.70 * (t - 60) ** -0.1332, 0, 255)
-        g = np.clip(288.12 * (t - 60) ** -0.0755, 0, 255)
+        r = max(0.0, min(255.0, 329.70 * (t - 60) ** -0.1332))
+        g = max(0.0, min(255.0, 288.12 * (t - 60) ** -0.0755))
         b = 255
     return (r / 255.0, g / 255.0, b / 255.0)
 
@@ -128,6 +136,12 @@ def body_color(body: dict) -> tuple[float, float, float]:
     return (0.6, 0.6, 0.6)
 
 
+@cache
+def cached_body_color(body_id: str) -> tuple[float, float, float]:
+    """Color of the body with the given id, computed once per process."""
+    return body_color(_BODIES_BY_ID[body_id])
+
+
 def hsl_to_rgb(h: float, s: float, l: float) -> tuple[float, float, float]:
     """Small HSL→RGB converter."""
     c = (1 - abs(2 * l - 1)) * s
@@ -172,7 +186,7 @@ def draw_circles(ax, scale_func, title: str):
     # Sun - half circle on the left edge
     sun_body = bodies[0]
     sun_r = scale_func(float(sun_body["radius_km"]))
-    sun_col = body_color(sun_body)
+    sun_col = cached_body_color(sun_body["id"])
 
     # Draw half sun (right half visible)
     theta = np.linspace(-np.pi / 2, np.pi / 2, 100)
@@ -196,17 +210,22 @@ def draw_circles(ax, scale_func, title: str):
     # Calculate positions for planets (skip sun)
     for body in bodies[1:]:
         r = scale_func(float(body["radius_km"]))
-        col = body_color(body)
+        col = cached_body_color(body["id"])
 
         x_offset += r  # Add radius to position center
         positions.append((x_offset, r, col, body["name"]))
         x_offset += r * 4.0  # Much more spacing between planets
 
-    # Draw planets
+    # Draw planets (all circles in a single collection)
     max_radius = sun_r
-    for x, r, col, name in positions:
-        circ = plt.Circle((x, 0.0), r, color=col, ec="white", linewidth=0.8)
-        ax.add_patch(circ)
+    circles = PatchCollection(
+        [plt.Circle((x, 0.0), r) for x, r, _, _ in positions],
+        facecolors=[col for _, _, col, _ in positions],
+        edgecolors="white",
+        linewidths=0.8,
+    )
+    ax.add_collection(circles)
+    for x, r, _, name in positions:
         ax.text(x, -r * 1.5, name, ha="center", va="top", fontsize=9, color="white")
         max_radius = max(max_radius, r)
 
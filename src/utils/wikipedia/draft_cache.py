@@ -0,0 +1,181 @@
+# src/utils/wikipedia/draft_cache.py
+"""
+Cache persistant des brouillons d'exoplanètes.
+
+Responsabilité :
+- Calculer une empreinte stable d'une exoplanète et de son système
+- Stocker les brouillons générés (mémoire + SQLite) pour les réutiliser
+  d'une exécution à l'autre tant que les données et le code sont inchangés
+"""
+
+import dataclasses
+import hashlib
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.generators.base.base_wikipedia_article_generator import (
+    BaseWikipediaArticleGenerator,
+)
+from src.models.entities.exoplanet_entity import Exoplanet
+from src.models.references.reference import Reference
+
+logger = logging.getLogger(__name__)
+
+DRAFT_CACHE_FILENAME = "exoplanet_drafts.sqlite3"
+
+# Répertoires dont le contenu influence le texte des brouillons
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+_FINGERPRINTED_DIRS = ("generators", "utils", "constants", "models")
+
+# Champs hachés tels quels ; la référence est réduite à ce que le brouillon affiche
+_HASHED_FIELDS = tuple(f.name for f in dataclasses.fields(Exoplanet) if f.name != "reference")
+
+_code_fingerprint: str | None = None
+
+
+def _compute_code_fingerprint() -> str:
+    """
+    Calcule l'empreinte du code de génération (une seule fois par processus).
+
+    Toute modification d'un générateur, d'un formateur ou d'une règle de catégorie
+    change l'empreinte et invalide donc les brouillons en cache.
+    """
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for directory in _FINGERPRINTED_DIRS:
+            for path in sorted((_SOURCE_ROOT / directory).rglob("*")):
+                if path.suffix in (".py", ".yaml"):
+                    digest.update(str(path.relative_to(_SOURCE_ROOT)).encode())
+                    digest.update(path.read_bytes())
+        _code_fingerprint = digest.hexdigest()
+    return _code_fingerprint
+
+
+def _reference_fingerprint(reference: Reference | None) -> tuple | None:
+    """
+    Réduit une référence aux valeurs qui identifient la source du brouillon.
+
+    Les collecteurs horodatent les dates de mise à jour et de consultation à chaque
+    exécution : les garder au jour près invaliderait tout le cache chaque jour. Seul
+    leur mois entre dans la clé, comme pour le modèle {{Source unique}} ; un brouillon
+    relu du cache garde donc les dates du premier run du mois où il a été généré.
+    """
+    if reference is None:
+        return None
+    return (
+        reference.source,
+        reference.update_date.strftime("%Y-%m"),
+        reference.consultation_date.strftime("%Y-%m"),
+        reference.star_id,
+        reference.planet_id,
+    )
+
+
+def _exoplanet_fingerprint(exoplanet: Exoplanet) -> bytes:
+    """Sérialise les champs d'une exoplanète qui influencent son brouillon."""
+    values = tuple(getattr(exoplanet, name) for name in _HASHED_FIELDS)
+    return repr((values, _reference_fingerprint(exoplanet.reference))).encode()
+
+
+def compute_draft_cache_key(
+    exoplanet: Exoplanet, system_planets: list[Exoplanet] | None = None
+) -> str:
+    """
+    Calcule la clé de cache d'un brouillon d'exoplanète.
+
+    La clé couvre tous les champs de la planète, ceux des planètes de son système
+    (utilisés par les sections système), le mois affiché par le modèle {{Source unique}}
+    et l'empreinte du code de génération.
+
+    Args:
+        exoplanet: Exoplanète dont on génère le brouillon
+        system_planets: Planètes du même système
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_compute_code_fingerprint().encode())
+    digest.update(BaseWikipediaArticleGenerator._format_french_month_year().encode())
+    digest.update(_exoplanet_fingerprint(exoplanet))
+    for sibling in sorted(system_planets or [], key=lambda p: str(p.pl_name)):
+        digest.update(_exoplanet_fingerprint(sibling))
+    return digest.hexdigest()
+
+
+class DraftCache:
+    """
+    Cache clé/valeur des brouillons, adossé à un fichier SQLite.
+
+    Les lectures passent d'abord par un dictionnaire en mémoire ; les écritures
+    sont regroupées et validées en une seule transaction par lot. Les clés lues ou
+    écrites sont retenues pour que prune_untouched() purge celles devenues inutiles.
+    """
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, DRAFT_CACHE_FILENAME)
+        self._memory: dict[str, str] = {}
+        self._touched: set[str] = set()
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS drafts (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> str | None:
+        """Retourne le brouillon associé à la clé, ou None s'il est absent."""
+        self._touched.add(key)
+        content = self._memory.get(key)
+        if content is None:
+            row = self._connection.execute(
+                "SELECT content FROM drafts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                content = row[0]
+                self._memory[key] = content
+        return content
+
+    def put_many(self, items: Iterable[tuple[str, str]]) -> None:
+        """Enregistre un lot de couples (clé, brouillon)."""
+        items = list(items)
+        if not items:
+            return
+        self._memory.update(items)
+        self._touched.update(key for key, _ in items)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO drafts (key, content) VALUES (?, ?)", items
+            )
+
+    def prune_untouched(self) -> int:
+        """
+        Supprime les brouillons dont la clé n'a été ni lue ni écrite par cette instance.
+
+        À appeler en fin d'exécution : les brouillons de planètes modifiées, disparues
+        ou d'un mois précédent ne s'accumulent pas d'un run à l'autre.
+
+        Returns:
+            int: Nombre de brouillons supprimés
+        """
+        with self._connection:
+            self._connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS touched (key TEXT PRIMARY KEY)"
+            )
+            self._connection.execute("DELETE FROM touched")
+            self._connection.executemany(
+                "INSERT INTO touched (key) VALUES (?)", ((key,) for key in self._touched)
+            )
+            deleted = self._connection.execute(
+                "DELETE FROM drafts WHERE key NOT IN (SELECT key FROM touched)"
+            ).rowcount
+        self._memory = {k: v for k, v in self._memory.items() if k in self._touched}
+        return deleted
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        self._connection.close()
@@ -22,6 +22,8 @@ class TestCLIParser:
         assert args.skip_wikipedia_check is False
         assert args.output_dir == DEFAULT_OUTPUT_DIR
         assert args.drafts_dir == DEFAULT_DRAFTS_DIR
+        assert args.draft_cache is True
+        assert args.compare_existing is False
 
     @patch("sys.argv", ["main.py", "--sources", "nasa_exoplanet_archive", "exoplanet_eu"])
     def test_parse_multiple_sources(self):
@@ -67,3 +69,17 @@ class TestCLIParser:
 
         assert "nasa_exoplanet_archive" in args.use_mock
         assert args.skip_wikipedia_check is True
+
+    @patch("sys.argv", ["main.py", "--no-draft-cache"])
+    def test_parse_no_draft_cache(self):
+        """Test de l'option no-draft-cache."""
+        args = parse_cli_arguments()
+
+        assert args.draft_cache is False
+
+    @patch("sys.argv", ["main.py", "--compare-existing"])
+    def test_parse_compare_existing(self):
+        """Test de l'option compare-existing."""
+        args = parse_cli_arguments()
+
+        assert args.compare_existing is True
@@ -4,6 +4,7 @@ Tests unitaires pour le module data_pipeline.
 Ce module teste les fonctions de collecte, ingestion et export de données.
 """
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, mock_open, patch
 
@@ -14,7 +15,9 @@ from src.models.entities.star_entity import Star
 from src.models.references.reference import Reference, SourceType
 from src.orchestration.data_pipeline import (
     _export_statistics_json,
+    _log_category_stats,
     _log_statistics,
+    build_source_prefix,
     export_consolidated_data,
     fetch_and_ingest_data,
     generate_and_export_statistics,
@@ -172,7 +175,7 @@ class TestExportConsolidatedData:
         export_consolidated_data(mock_processor, output_dir, timestamp)
 
         # Vérifier que l'export a été appelé
-        expected_path = f"{output_dir}/consolidated/exoplanets_consolidated_{timestamp}.csv"
+        expected_path = f"{output_dir}/consolidated/consolidated_{timestamp}.csv"
         mock_processor.export_all_exoplanets.assert_called_once_with("csv", expected_path)
 
     def test_export_consolidated_data_exception(self, mock_processor, tmp_path):
@@ -185,6 +188,24 @@ class TestExportConsolidatedData:
         # Ne doit pas lever d'exception, juste logger une erreur
         export_consolidated_data(mock_processor, output_dir, timestamp)
 
+    def test_export_consolidated_data_with_prefix(self, mock_processor, tmp_path):
+        """Test que le préfixe fourni est utilisé tel quel."""
+        output_dir = str(tmp_path)
+
+        export_consolidated_data(mock_processor, output_dir, "ts", "exoplanet_eu_nea")
+
+        expected_path = f"{output_dir}/consolidated/exoplanet_eu_nea_ts.csv"
+        mock_processor.export_all_exoplanets.assert_called_once_with("csv", expected_path)
+
+    def test_build_source_prefix(self):
+        """Test du préfixe construit à partir des sources (triées, abrégées)."""
+        assert build_source_prefix({"nasa_exoplanet_archive": 1, "exoplanet_eu": 2}.keys()) == (
+            "exoplanet_eu_nea"
+        )
+        assert build_source_prefix(["custom"]) == "custom"
+        assert build_source_prefix([]) == "consolidated"
+        assert build_source_prefix(None) == "consolidated"
+
 
 class TestGenerateAndExportStatistics:
     """Tests pour generate_and_export_statistics."""
@@ -285,6 +306,31 @@ class TestLogStatistics:
         # Ne doit pas lever d'exception
         _log_statistics(stats)
 
+    @patch("src.orchestration.data_pipeline.logger")
+    def test_log_category_stats_single_call(self, mock_logger):
+        """Test qu'une catégorie est journalisée en un seul message multi-ligne."""
+        _log_category_stats("Par année", {2021: 1, 2020: 3}, total=4, sort_keys=True)
+
+        mock_logger.info.assert_called_once_with(
+            "  Par année :\n    - 2020 : 3 (75.0%)\n    - 2021 : 1 (25.0%)"
+        )
+
+    @patch("src.orchestration.data_pipeline.logger")
+    def test_log_category_stats_zero_total(self, mock_logger):
+        """Test du pourcentage nul quand le total est nul."""
+        _log_category_stats("Par méthode", {"Transit": 0}, total=0)
+
+        mock_logger.info.assert_called_once_with("  Par méthode :\n    - Transit : 0 (0.0%)")
+
+    @patch("src.orchestration.data_pipeline.logger")
+    def test_log_statistics_skipped_when_info_disabled(self, mock_logger):
+        """Test qu'aucun message n'est construit si le niveau INFO est désactivé."""
+        mock_logger.isEnabledFor.return_value = False
+
+        _log_statistics({"exoplanet": {"total": 1, "discovery_methods": {"Transit": 1}}})
+
+        mock_logger.info.assert_not_called()
+
 
 class TestExportStatisticsJson:
     """Tests pour _export_statistics_json."""
@@ -304,3 +350,32 @@ class TestExportStatisticsJson:
 
         # Vérifier que le fichier a été ouvert
         assert mock_file.called
+
+    def test_export_statistics_json_sorts_nested_keys(self, tmp_path):
+        """Test que les clés imbriquées sont triées dans le fichier JSON."""
+        stats = {"star": {"b": 2, "a": 1}, "exoplanet": {"years": {2020: 3, 1999: 1}}}
+        timestamp = "20231120_120000"
+
+        _export_statistics_json(stats, str(tmp_path), timestamp)
+
+        content = (tmp_path / "statistics" / f"statistics_{timestamp}.json").read_text(
+            encoding="utf-8"
+        )
+        assert content.index('"exoplanet"') < content.index('"star"')
+        assert content.index('"1999"') < content.index('"2020"')
+        assert content.index('"a"') < content.index('"b"')
+
+    def test_export_statistics_json_without_orjson(self, tmp_path):
+        """Test du repli sur json standard, avec le même contenu qu'avec orjson."""
+        stats = {"star": {"Étoile": 2}, "exoplanet": {"years": {2020: 3, 1999: 1}}}
+        path = tmp_path / "statistics" / "statistics_ts.json"
+
+        _export_statistics_json(stats, str(tmp_path), "ts")
+        expected = json.loads(path.read_text(encoding="utf-8"))
+
+        with patch("src.orchestration.data_pipeline.orjson", None):
+            _export_statistics_json(stats, str(tmp_path), "ts")
+
+        content = path.read_text(encoding="utf-8")
+        assert "Étoile" in content
+        assert json.loads(content) == expected
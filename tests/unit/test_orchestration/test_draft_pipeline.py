@@ -15,6 +15,7 @@ from src.models.references.reference import Reference, SourceType
 from src.orchestration.draft_pipeline import (
     generate_and_persist_exoplanet_drafts,
     generate_and_persist_star_drafts,
+    generate_and_persist_star_drafts_separated,
 )
 
 
@@ -160,3 +161,26 @@ class TestDraftPipeline:
         mock_logger.warning.assert_called_once()
         assert "Objet ignoré" in mock_logger.warning.call_args[0][0]
         mock_persist.assert_called_once()
+
+    @patch("src.orchestration.draft_pipeline.persist_drafts_by_entity_type")
+    @patch("src.orchestration.draft_pipeline.build_star_article_draft")
+    def test_generate_star_drafts_separated_reuses_index(
+        self, mock_build, mock_persist, mock_processor, sample_stars
+    ):
+        """Test que l'index fourni est utilisé tel quel, sans regrouper les exoplanètes."""
+        mock_processor.collect_all_stars.return_value = sample_stars
+        star_name = sample_stars[0].st_name
+        planet = Mock(pl_name="Indexed b")
+        # Exoplanète absente de l'index : ne doit pas être regroupée à nouveau
+        exoplanets = [Mock(pl_name="Other b", st_name=star_name)]
+
+        generate_and_persist_star_drafts_separated(
+            mock_processor,
+            "drafts",
+            exoplanets,
+            existing_star_articles={},
+            missing_star_articles={star_name: {}},
+            exoplanets_by_star_name={star_name: [planet]},
+        )
+
+        mock_build.assert_called_once_with(sample_stars[0], exoplanets=[planet])
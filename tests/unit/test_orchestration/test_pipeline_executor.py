@@ -73,6 +73,7 @@ class TestExecutePipeline:
             sources=["nasa"],
             generate_exoplanets=True,
             generate_stars=True,
+            compare_existing=True,
         )
 
     @patch("src.orchestration.pipeline_executor.create_output_directories")
@@ -140,7 +141,7 @@ class TestExecutePipeline:
                 wiki_service,
                 export_service,
             )
-            mock_collectors.return_value = [Mock()]
+            mock_collectors.return_value = {"nasa": Mock()}
 
             # Exécution
             execute_pipeline(mock_args)
@@ -199,7 +200,7 @@ class TestExecutePipeline:
             wiki_service,
             export_service,
         )
-        mock_collectors.return_value = [Mock()]
+        mock_collectors.return_value = {"nasa": Mock()}
 
         # Mock processor
         mock_processor = Mock()
@@ -255,7 +256,7 @@ class TestExecutePipeline:
             wiki_service,
             export_service,
         )
-        mock_collectors.return_value = [Mock()]
+        mock_collectors.return_value = {"nasa": Mock()}
 
         # Mock processor
         mock_processor = Mock()
@@ -318,7 +319,7 @@ class TestExecutePipeline:
             wiki_service,
             export_service,
         )
-        mock_collectors.return_value = [Mock()]
+        mock_collectors.return_value = {"nasa": Mock()}
 
         # Mock processor
         mock_processor = Mock()
@@ -423,7 +424,7 @@ class TestExecutePipeline:
             wiki_service,
             export_service,
         )
-        mock_collectors.return_value = [Mock()]
+        mock_collectors.return_value = {"nasa": Mock()}
 
         # Mock processor
         mock_processor = Mock()
@@ -480,3 +481,114 @@ class TestExecutePipeline:
 
         # Vérifier que generate_and_persist_star_drafts_separated a été appelé
         mock_star_drafts_separated.assert_called_once()
+
+    @patch("src.orchestration.pipeline_executor.create_output_directories")
+    @patch("src.orchestration.pipeline_executor.initialize_services")
+    @patch("src.orchestration.pipeline_executor.initialize_collectors")
+    @patch("src.orchestration.pipeline_executor.fetch_and_ingest_data")
+    @patch("src.orchestration.pipeline_executor.export_consolidated_data")
+    @patch("src.orchestration.pipeline_executor.generate_and_export_statistics")
+    @patch("src.utils.wikipedia.draft_util.build_exoplanet_article_draft")
+    @patch("src.utils.wikipedia.draft_util.persist_drafts_by_entity_type")
+    @patch("src.orchestration.draft_pipeline.generate_and_persist_star_drafts_separated")
+    def test_execute_pipeline_skips_existing_without_compare(
+        self,
+        mock_star_drafts_separated,
+        mock_persist_drafts,
+        mock_build_draft,
+        mock_stats,
+        mock_export,
+        mock_ingest,
+        mock_collectors,
+        mock_services,
+        mock_create_dirs,
+        mock_args,
+    ):
+        """Test que les brouillons existants ne sont pas générés sans --compare-existing."""
+        mock_args.compare_existing = False
+        mock_services.return_value = (Mock(), Mock(), Mock(), Mock(), Mock())
+        mock_collectors.return_value = {"nasa": Mock()}
+
+        mock_processor = Mock()
+        mock_processor.resolve_wikipedia_status_for_exoplanets.return_value = (
+            ["Existing Planet"],
+            ["Missing Planet"],
+        )
+        mock_processor.resolve_wikipedia_status_for_stars.return_value = ([], [])
+
+        mock_planet1 = Mock()
+        mock_planet1.pl_name = "Existing Planet"
+        mock_planet1.st_name = "Existing Star"
+        mock_planet2 = Mock()
+        mock_planet2.pl_name = "Missing Planet"
+        mock_planet2.st_name = "Missing Star"
+        mock_processor.collect_all_exoplanets.return_value = [mock_planet1, mock_planet2]
+
+        mock_build_draft.side_effect = lambda exo, system_planets=None: f"Draft for {exo.pl_name}"
+
+        with patch(
+            "src.orchestration.pipeline_executor._initialize_data_processor",
+            return_value=mock_processor,
+        ):
+            execute_pipeline(mock_args)
+
+        # Seule la planète manquante est générée
+        mock_build_draft.assert_called_once()
+        mock_persist_drafts.assert_called_once_with(
+            {"Missing Planet": "Draft for Missing Planet"}, {}, "drafts", "exoplanet"
+        )
+
+        # Les deux ensembles couvrent toutes les exoplanètes : l'index est réutilisé
+        star_kwargs = mock_star_drafts_separated.call_args.kwargs
+        assert star_kwargs["exoplanets_by_star_name"] is not None
+
+    @patch("src.orchestration.pipeline_executor.create_output_directories")
+    @patch("src.orchestration.pipeline_executor.initialize_services")
+    @patch("src.orchestration.pipeline_executor.initialize_collectors")
+    @patch("src.orchestration.pipeline_executor.fetch_and_ingest_data")
+    @patch("src.orchestration.pipeline_executor.export_consolidated_data")
+    @patch("src.orchestration.pipeline_executor.generate_and_export_statistics")
+    @patch("src.utils.wikipedia.draft_util.build_exoplanet_article_draft")
+    @patch("src.utils.wikipedia.draft_util.persist_drafts_by_entity_type")
+    @patch("src.orchestration.draft_pipeline.generate_and_persist_star_drafts_separated")
+    def test_execute_pipeline_star_index_excludes_unresolved_exoplanets(
+        self,
+        mock_star_drafts_separated,
+        mock_persist_drafts,
+        mock_build_draft,
+        mock_stats,
+        mock_export,
+        mock_ingest,
+        mock_collectors,
+        mock_services,
+        mock_create_dirs,
+        mock_args,
+    ):
+        """Test qu'une exoplanète sans statut Wikipedia n'est pas rattachée aux étoiles."""
+        mock_services.return_value = (Mock(), Mock(), Mock(), Mock(), Mock())
+        mock_collectors.return_value = {"nasa": Mock()}
+
+        mock_processor = Mock()
+        mock_processor.resolve_wikipedia_status_for_exoplanets.return_value = (
+            [],
+            ["Missing Planet"],
+        )
+        mock_processor.resolve_wikipedia_status_for_stars.return_value = ([], [])
+
+        mock_missing = Mock(pl_name="Missing Planet", st_name="Shared Star")
+        mock_unresolved = Mock(pl_name="Unresolved Planet", st_name="Shared Star")
+        mock_processor.collect_all_exoplanets.return_value = [mock_missing, mock_unresolved]
+
+        mock_build_draft.side_effect = lambda exo, system_planets=None: f"Draft for {exo.pl_name}"
+
+        with patch(
+            "src.orchestration.pipeline_executor._initialize_data_processor",
+            return_value=mock_processor,
+        ):
+            execute_pipeline(mock_args)
+
+        # Le pipeline des étoiles reconstruit son index à partir des seules exoplanètes
+        # manquantes ou existantes, comme avant la réutilisation de l'index
+        star_args = mock_star_drafts_separated.call_args
+        assert star_args.args[2] == [mock_missing]
+        assert star_args.kwargs["exoplanets_by_star_name"] is None
@@ -1,10 +1,20 @@
 import argparse
+import logging
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import Mock, patch
 
+import pytest
+
+from src.models.entities.exoplanet_entity import Exoplanet
 from src.orchestration.pipeline_executor import (
+    _build_exoplanet_drafts,
+    _index_and_partition_exoplanets,
     _initialize_data_processor,
+    _iter_draft_items,
     _setup_output_directories,
 )
+from src.utils.wikipedia.draft_cache import DraftCache
 
 
 class TestPipelineExecutorHelpers:
@@ -51,3 +61,155 @@ class TestPipelineExecutorHelpers:
                 export_service=export_service,
             )
             assert result == mock_instance
+
+    def test_build_exoplanet_drafts_sequential(self):
+        planet_a = Mock(pl_name="A b", st_name="A")
+        planet_b = Mock(pl_name="B b", st_name=None)
+        index = {"A": [planet_a]}
+
+        with patch(
+            "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+            side_effect=lambda exo, system_planets=None: f"{exo.pl_name}:{len(system_planets)}",
+        ):
+            drafts = _build_exoplanet_drafts([planet_a, planet_b], index, "test")
+
+        assert drafts == {"A b": "A b:1", "B b": "B b:0"}
+
+    def test_build_exoplanet_drafts_falls_back_when_pool_fails(self):
+        planets = [Mock(pl_name=f"P{i}", st_name=None) for i in range(3)]
+
+        with (
+            patch("src.orchestration.pipeline_executor.PARALLEL_DRAFT_THRESHOLD", 1),
+            patch(
+                "src.orchestration.pipeline_executor.ProcessPoolExecutor",
+                side_effect=BrokenProcessPool("boom"),
+            ),
+            patch(
+                "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+                return_value="draft",
+            ) as mock_build,
+        ):
+            drafts = _build_exoplanet_drafts(planets, {}, "test")
+
+        assert mock_build.call_count == 3
+        assert set(drafts) == {"P0", "P1", "P2"}
+
+    def test_build_exoplanet_drafts_falls_back_when_items_not_picklable(self):
+        planets = [Exoplanet(pl_name=f"P{i}", st_name=None) for i in range(3)]
+        planets[0].disc_method = lambda: None  # objet local : non sérialisable
+
+        with (
+            patch("src.orchestration.pipeline_executor.PARALLEL_DRAFT_THRESHOLD", 1),
+            patch("src.orchestration.pipeline_executor.ProcessPoolExecutor") as mock_pool,
+            patch(
+                "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+                return_value="draft",
+            ) as mock_build,
+        ):
+            drafts = _build_exoplanet_drafts(planets, {}, "test")
+
+        mock_pool.assert_not_called()
+        assert mock_build.call_count == 3
+        assert set(drafts) == {"P0", "P1", "P2"}
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="les patchs ne sont hérités par les workers que via fork",
+    )
+    def test_build_exoplanet_drafts_propagates_worker_errors(self):
+        planets = [Exoplanet(pl_name=f"P{i}", st_name=None) for i in range(3)]
+
+        with (
+            patch("src.orchestration.pipeline_executor.PARALLEL_DRAFT_THRESHOLD", 1),
+            patch(
+                "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+                side_effect=TypeError("planète malformée"),
+            ) as mock_build,
+        ):
+            with pytest.raises(TypeError, match="planète malformée"):
+                _build_exoplanet_drafts(planets, {}, "test")
+
+        # Erreur levée dans les workers : pas de seconde passe séquentielle dans le parent
+        mock_build.assert_not_called()
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="les patchs ne sont hérités par les workers que via fork",
+    )
+    def test_worker_log_records_reach_handler(self, tmp_path):
+        planets = [Exoplanet(pl_name=f"P{i}", st_name=None) for i in range(3)]
+        log_file = tmp_path / "astro_builder.log"
+
+        def build_and_log(exo, system_planets=None):
+            logging.getLogger("worker").warning(f"brouillon {exo.pl_name}")
+            # Handlers du worker : doivent écrire directement, sans file d'attente
+            return ",".join(type(h).__name__ for h in logging.getLogger().handlers)
+
+        with (
+            patch("src.orchestration.pipeline_executor.PARALLEL_DRAFT_THRESHOLD", 1),
+            patch("src.core.config.OPS_LOG_DIR", str(tmp_path)),
+            patch("src.core.config.LOG_FILE", str(log_file)),
+            patch(
+                "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+                side_effect=build_and_log,
+            ),
+        ):
+            drafts = _build_exoplanet_drafts(planets, {}, "test")
+
+        assert set(drafts) == {"P0", "P1", "P2"}
+        assert all(handlers == "StreamHandler,FileHandler" for handlers in drafts.values())
+        log = log_file.read_text(encoding="utf-8")
+        for name in ("P0", "P1", "P2"):
+            assert f"WARNING - brouillon {name}" in log
+
+    def test_index_and_partition_exoplanets(self):
+        planet_a = Exoplanet(pl_name="A b", st_name="A")
+        planet_b = Exoplanet(pl_name="A c", st_name="A")
+        planet_c = Exoplanet(pl_name="C b", st_name=None)
+        planet_d = Exoplanet(pl_name="D b", st_name="D")
+
+        index, missing, existing = _index_and_partition_exoplanets(
+            [planet_a, planet_b, planet_c, planet_d],
+            existing_articles={"A b": {}},
+            missing_articles=["A c", "C b"],
+        )
+
+        assert index == {"A": [planet_a, planet_b], "D": [planet_d]}
+        assert missing == [planet_b, planet_c]
+        assert existing == [planet_a]
+
+    def test_iter_draft_items_shares_system_list_per_star(self):
+        planet_a = Exoplanet(pl_name="A b", st_name="A")
+        planet_b = Exoplanet(pl_name="A c", st_name="A")
+        planet_c = Exoplanet(pl_name="C b", st_name=None)
+        planet_d = Exoplanet(pl_name="D b", st_name="D")
+        index = {"A": [planet_a, planet_b], "D": [planet_d]}
+
+        items = list(_iter_draft_items([planet_c, planet_b, planet_a], index))
+
+        assert [exo for exo, _ in items] == [planet_a, planet_b, planet_c]
+        assert items[0][1] is index["A"]
+        assert items[1][1] is index["A"]
+        assert items[2][1] == []
+
+    def test_build_exoplanet_drafts_reuses_cached_drafts(self, tmp_path):
+        planet_a = Exoplanet(pl_name="A b", st_name="A")
+        planet_b = Exoplanet(pl_name="A c", st_name="A")
+        index = {"A": [planet_a, planet_b]}
+        cache = DraftCache(str(tmp_path))
+
+        try:
+            with patch(
+                "src.utils.wikipedia.draft_util.build_exoplanet_article_draft",
+                side_effect=lambda exo, system_planets=None: f"draft {exo.pl_name}",
+            ) as mock_build:
+                first = _build_exoplanet_drafts([planet_a], index, "test", draft_cache=cache)
+                second = _build_exoplanet_drafts(
+                    [planet_a, planet_b], index, "test", draft_cache=cache
+                )
+        finally:
+            cache.close()
+
+        assert first == {"A b": "draft A b"}
+        assert second == {"A b": "draft A b", "A c": "draft A c"}
+        assert mock_build.call_count == 2
@@ -96,6 +96,16 @@ class TestDataProcessor:
             exoplanets, "NEA"
         )
 
+    def test_ingest_exoplanets_normalizes_star_name(self, data_processor, sample_exoplanet):
+        """Test que st_name est converti une seule fois en str à l'ingestion."""
+        sample_exoplanet.st_name = 1234
+        other = Exoplanet(pl_name="Other b", st_name=None)
+
+        data_processor.ingest_exoplanets_from_source([sample_exoplanet, other], "NEA")
+
+        assert sample_exoplanet.st_name == "1234"
+        assert other.st_name is None
+
     def test_ingest_stars_from_source(
         self, data_processor, mock_repositories_and_services, sample_star
     ):
@@ -9,6 +9,7 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+from src.core.config import WRITE_BUFFER_SIZE
 from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
 from src.models.references.reference import Reference, SourceType
 from src.services.external.export_service import ExportService
@@ -113,8 +114,10 @@ class TestExportService:
         filename = str(tmp_path / "test_export.csv")
         export_service.export_exoplanets_to_csv(filename, sample_exoplanets)
 
-        # Vérifier que le fichier a été ouvert en écriture
-        mock_file.assert_called_once_with(filename, "w", newline="", encoding="utf-8")
+        # Vérifier que le fichier a été ouvert en écriture avec un tampon élargi
+        mock_file.assert_called_once_with(
+            filename, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        )
 
     def test_export_exoplanets_to_csv_empty_list(self, export_service, tmp_path):
         """Test d'export CSV avec liste vide."""
@@ -132,8 +135,10 @@ class TestExportService:
         filename = str(tmp_path / "test_export.json")
         export_service.export_exoplanets_to_json(filename, sample_exoplanets)
 
-        # Vérifier que le fichier a été ouvert en écriture
-        mock_file.assert_called_once_with(filename, "w", encoding="utf-8")
+        # Vérifier que le fichier a été ouvert en écriture avec un tampon élargi
+        mock_file.assert_called_once_with(
+            filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        )
 
     def test_export_exoplanets_to_json_empty_list(self, export_service, tmp_path):
         """Test d'export JSON avec liste vide."""
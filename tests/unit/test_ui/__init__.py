@@ -0,0 +1,2 @@
+# tests/unit/test_ui/__init__.py
+"""Tests for ui module."""
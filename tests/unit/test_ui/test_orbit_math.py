@@ -0,0 +1,142 @@
+"""Tests pour la mécanique orbitale partagée des vues Streamlit."""
+
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+from src.ui.orbit_math import (
+    batch_positions,
+    calculate_position,
+    generate_orbit,
+    orbit_key,
+    precompute_orbits,
+    solve_kepler,
+    solve_kepler_markley,
+)
+
+MEAN_ANOMALIES = np.linspace(-np.pi, np.pi, 721)
+
+
+def _reference_eccentric_anomaly(mean_anomaly, eccentricity):
+    """E par dichotomie (|E - M| <= e et E - e·sin(E) croissante), M ramené dans [-π, π)."""
+    M = np.remainder(mean_anomaly + np.pi, 2 * np.pi) - np.pi
+    low, high = M - eccentricity, M + eccentricity
+    for _ in range(80):
+        mid = (low + high) / 2
+        too_high = mid - eccentricity * np.sin(mid) > M
+        high = np.where(too_high, mid, high)
+        low = np.where(too_high, low, mid)
+    return (low + high) / 2
+
+
+def _angle_error(angle, reference):
+    """Écart angulaire maximal, à 2π près."""
+    return np.max(np.abs(np.remainder(angle - reference + np.pi, 2 * np.pi) - np.pi))
+
+
+class TestSolveKepler:
+    """Tests pour solve_kepler et solve_kepler_markley."""
+
+    @pytest.mark.parametrize("eccentricity", [0.0, 0.3, 0.6, 0.9, 0.99, 0.999])
+    def test_markley_machine_precision(self, eccentricity):
+        """Markley atteint la précision machine jusqu'aux orbites très excentriques."""
+        E, sin_e, cos_e = solve_kepler_markley(MEAN_ANOMALIES, eccentricity)
+        reference = _reference_eccentric_anomaly(MEAN_ANOMALIES, eccentricity)
+
+        assert _angle_error(E, reference) < 1e-12
+        assert np.max(np.abs(sin_e - np.sin(reference))) < 1e-12
+        assert np.max(np.abs(cos_e - np.cos(reference))) < 1e-12
+
+    @pytest.mark.parametrize("eccentricity", [0.002, 0.05, 0.2, 0.29])
+    def test_low_eccentricity_path(self, eccentricity):
+        """Meeus + un pas de Newton reste sous 3e-6 rad pour e < 0.3."""
+        E, sin_e, cos_e = solve_kepler(MEAN_ANOMALIES, eccentricity)
+        reference = _reference_eccentric_anomaly(MEAN_ANOMALIES, eccentricity)
+
+        assert _angle_error(E, reference) < 3e-6
+        assert np.max(np.abs(sin_e - np.sin(E))) < 1e-9
+        assert np.max(np.abs(cos_e - np.cos(E))) < 1e-9
+
+    def test_circular_path(self):
+        """Orbite quasi circulaire : E = M + e·sin(M), exact à e²/2 près."""
+        E, sin_e, cos_e = solve_kepler(MEAN_ANOMALIES, 5e-4)
+        reference = _reference_eccentric_anomaly(MEAN_ANOMALIES, 5e-4)
+
+        assert _angle_error(E, reference) < 5e-7
+        assert np.max(np.abs(sin_e - np.sin(E))) < 1e-12
+
+    def test_mixed_eccentricities_use_markley(self):
+        """Une seule excentricité élevée dans le tableau suffit à passer par Markley."""
+        eccentricity = np.array([0.01, 0.2, 0.95])
+        M = np.array([0.5, 1.5, 2.5])
+
+        E, _, _ = solve_kepler(M, eccentricity)
+
+        np.testing.assert_allclose(E, _reference_eccentric_anomaly(M, eccentricity), atol=1e-12)
+
+    def test_mean_anomaly_beyond_one_orbit(self):
+        """M au-delà de 2π donne la même position qu'après réduction modulo 2π."""
+        eccentricity = np.array([0.1, 0.5])
+        M = np.array([0.7, 2.1])
+
+        _, sin_e, cos_e = solve_kepler(M + 6 * np.pi, eccentricity)
+        _, sin_ref, cos_ref = solve_kepler(M, eccentricity)
+
+        np.testing.assert_allclose(sin_e, sin_ref, atol=1e-12)
+        np.testing.assert_allclose(cos_e, cos_ref, atol=1e-12)
+
+    def test_scalar_input(self):
+        """Les entrées scalaires sont acceptées."""
+        E, _, _ = solve_kepler(1.0, 0.5)
+        assert E - 0.5 * np.sin(E) == pytest.approx(1.0, abs=1e-12)
+
+
+class TestPositions:
+    """Tests pour calculate_position et batch_positions."""
+
+    def test_perihelion_and_aphelion(self):
+        """t = 0 au périhélie, t = 0.5 à l'aphélie."""
+        x, y = calculate_position(2.0, 0.5, np.array([0.0, 0.5]))
+
+        np.testing.assert_allclose(x, [1.0, -3.0], atol=1e-12)
+        np.testing.assert_allclose(y, [0.0, 0.0], atol=1e-12)
+
+    def test_batch_positions_matches_calculate_position(self):
+        """batch_positions (numba ou NumPy) donne les mêmes positions instant par instant."""
+        a = np.array([1.0, 2.0, 5.0])
+        e = np.array([0.0167, 0.2, 0.9])
+        periods = np.array([365.0, 687.0, 4000.0])
+        times = np.linspace(0, 10000, 50)
+
+        xs, ys = batch_positions(a, e, periods, times)
+
+        assert xs.shape == ys.shape == (50, 3)
+        for k, t in enumerate(times):
+            x, y = calculate_position(a, e, t / periods)
+            np.testing.assert_allclose(xs[k], x, atol=1e-6)
+            np.testing.assert_allclose(ys[k], y, atol=1e-6)
+
+
+class TestOrbits:
+    """Tests pour generate_orbit et precompute_orbits."""
+
+    def test_generate_orbit_is_closed(self):
+        """Le tracé est fermé et en float32."""
+        x, y = generate_orbit(1.5, 0.3, num_points=100)
+
+        assert len(x) == len(y) == 100
+        assert x.dtype == y.dtype == np.float32
+        assert (x[-1], y[-1]) == (x[0], y[0])
+
+    def test_precompute_orbits_both_scales(self):
+        """Demi-grands axes et orbites sont fournis pour les deux échelles."""
+        Planet = namedtuple("Planet", "semi_major_axis eccentricity color")
+        specs = orbit_key([Planet(1.0, 0.0167, "#fff"), Planet(5.2, 0.049, "#000")])
+
+        scaled_a, orbits = precompute_orbits(specs)
+
+        np.testing.assert_allclose(scaled_a[False], [1.0, 5.2])
+        np.testing.assert_allclose(scaled_a[True], np.log1p([1.0, 5.2]) * 2.5)
+        assert len(orbits[True]) == len(orbits[False]) == 2
+        assert precompute_orbits(specs) is precompute_orbits(specs)
@@ -0,0 +1,158 @@
+"""Tests pour le cache des brouillons d'exoplanètes."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.references.reference import Reference, SourceType
+from src.utils.wikipedia.draft_cache import DraftCache, compute_draft_cache_key
+
+
+def _build_planet(name: str = "A b", timestamp: datetime | None = None) -> Exoplanet:
+    """Construit une planète comme le mapper NEA : références horodatées à l'instant."""
+    timestamp = timestamp or datetime.now()
+    reference = Reference(
+        source=SourceType.NEA,
+        update_date=timestamp,
+        consultation_date=timestamp,
+        star_id="A",
+        planet_id=name,
+    )
+    return Exoplanet(pl_name=name, st_name="A", reference=reference)
+
+
+class TestComputeDraftCacheKey:
+    """Tests pour compute_draft_cache_key."""
+
+    def test_key_is_stable(self):
+        """La même planète donne la même clé."""
+        planet = Exoplanet(pl_name="A b", st_name="A")
+        assert compute_draft_cache_key(planet, [planet]) == compute_draft_cache_key(
+            Exoplanet(pl_name="A b", st_name="A"), [planet]
+        )
+
+    def test_key_changes_with_planet_fields(self):
+        """Une donnée modifiée change la clé."""
+        planet = Exoplanet(pl_name="A b", st_name="A")
+        updated = Exoplanet(pl_name="A b", st_name="A", pl_mass=ValueWithUncertainty(value=1.0))
+        assert compute_draft_cache_key(planet) != compute_draft_cache_key(updated)
+
+    def test_key_changes_with_system_planets(self):
+        """Les planètes du système font partie de la clé, indépendamment de l'ordre."""
+        planet_b = Exoplanet(pl_name="A b", st_name="A")
+        planet_c = Exoplanet(pl_name="A c", st_name="A")
+
+        alone = compute_draft_cache_key(planet_b, [planet_b])
+        system = compute_draft_cache_key(planet_b, [planet_b, planet_c])
+        reordered = compute_draft_cache_key(planet_b, [planet_c, planet_b])
+
+        assert alone != system
+        assert system == reordered
+
+    def test_key_ignores_reference_time_of_day(self):
+        """Deux planètes construites séparément le même jour partagent la clé."""
+        first = _build_planet(timestamp=datetime(2026, 10, 14, 9, 30, 0, 123456))
+        second = _build_planet(timestamp=datetime(2026, 10, 14, 17, 45, 12, 654321))
+
+        assert compute_draft_cache_key(first, [first]) == compute_draft_cache_key(second, [second])
+
+    def test_key_ignores_reference_day_within_month(self):
+        """Un run le lendemain, dans le même mois, retrouve la même clé."""
+        planet = _build_planet(timestamp=datetime(2026, 10, 14, 9, 30))
+        next_day = _build_planet(timestamp=datetime(2026, 10, 14, 9, 30) + timedelta(days=1))
+
+        assert compute_draft_cache_key(planet) == compute_draft_cache_key(next_day)
+
+    def test_key_changes_with_reference_month(self):
+        """Le mois des dates de référence fait partie de la clé."""
+        planet = _build_planet(timestamp=datetime(2026, 10, 31, 23, 0))
+        next_month = _build_planet(timestamp=datetime(2026, 11, 1, 0, 30))
+
+        assert compute_draft_cache_key(planet) != compute_draft_cache_key(next_month)
+
+    def test_key_changes_with_month(self):
+        """Le mois du modèle {{Source unique}} fait partie de la clé."""
+        planet = _build_planet()
+        target = (
+            "src.generators.base.base_wikipedia_article_generator."
+            "BaseWikipediaArticleGenerator._format_french_month_year"
+        )
+
+        with patch(target, return_value="octobre 2026"):
+            october = compute_draft_cache_key(planet)
+        with patch(target, return_value="novembre 2026"):
+            november = compute_draft_cache_key(_build_planet())
+
+        assert october != november
+
+
+class TestDraftCache:
+    """Tests pour DraftCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture pour créer un cache dans un répertoire temporaire."""
+        draft_cache = DraftCache(str(tmp_path))
+        yield draft_cache
+        draft_cache.close()
+
+    def test_get_missing_key(self, cache):
+        """Une clé inconnue retourne None."""
+        assert cache.get("unknown") is None
+
+    def test_put_and_get(self, cache):
+        """Un brouillon enregistré est relu."""
+        cache.put_many([("k1", "draft 1"), ("k2", "draft 2")])
+
+        assert cache.get("k1") == "draft 1"
+        assert cache.get("k2") == "draft 2"
+
+    def test_persists_across_instances(self, tmp_path):
+        """Les brouillons sont relus depuis le disque par une nouvelle instance."""
+        first = DraftCache(str(tmp_path))
+        first.put_many([("k1", "draft 1")])
+        first.close()
+
+        second = DraftCache(str(tmp_path))
+        try:
+            assert second.get("k1") == "draft 1"
+        finally:
+            second.close()
+
+    def test_cache_hit_across_runs(self, tmp_path):
+        """Un brouillon enregistré au premier run est relu au second pour la même planète."""
+        first = DraftCache(str(tmp_path))
+        planet = _build_planet()
+        first.put_many([(compute_draft_cache_key(planet, [planet]), "draft A b")])
+        first.close()
+
+        second = DraftCache(str(tmp_path))
+        try:
+            rebuilt = _build_planet()
+            assert second.get(compute_draft_cache_key(rebuilt, [rebuilt])) == "draft A b"
+        finally:
+            second.close()
+
+    def test_prune_untouched(self, tmp_path):
+        """Seuls les brouillons lus ou écrits par l'instance survivent à la purge."""
+        first = DraftCache(str(tmp_path))
+        first.put_many([("k1", "draft 1"), ("k2", "draft 2")])
+        first.close()
+
+        second = DraftCache(str(tmp_path))
+        try:
+            assert second.get("k1") == "draft 1"
+            second.put_many([("k3", "draft 3")])
+            assert second.prune_untouched() == 1
+        finally:
+            second.close()
+
+        third = DraftCache(str(tmp_path))
+        try:
+            assert third.get("k1") == "draft 1"
+            assert third.get("k2") is None
+            assert third.get("k3") == "draft 3"
+        finally:
+            third.close()